@@ -0,0 +1,389 @@
+#!/usr/bin/python
+
+"""
+%(scriptname)s [-h|--help] [benchmark [benchmark [...]]] [file [file [...]]]
+    no args: run all benchmarks
+    benchmark(s): run the specified benchmark(s) (%(benchmarks)s)
+    file(s): recorded yahoo responses to use instead of synthesized ones, where supported
+    -h or --help: show usage
+
+Benchmarks run offline, against synthesized responses shaped like yahoo's.
+"""
+
+from __future__ import print_function
+
+import json
+import os
+import random
+import subprocess
+import sys
+import timeit
+import tracemalloc
+
+mark = '-' * 64
+
+DAY = 24 * 60 * 60
+
+
+# synthesize a v8/finance/chart response with daily bars over the given number of years
+def chart_payload(years=20, ticker='SYN'):
+    start = 946900800  # 2000-01-03 14:30 UTC, a market open
+    timestamps = [start + i * DAY for i in range(years * 365)]
+    price, quote = 100.0, {'open': [], 'high': [], 'low': [], 'close': [], 'volume': []}
+    for _ in timestamps:
+        price *= 1 + random.gauss(0, 0.01)
+        quote['open'].append(price * (1 + random.gauss(0, 0.002)))
+        quote['high'].append(price * 1.01)
+        quote['low'].append(price * 0.99)
+        quote['close'].append(price)
+        quote['volume'].append(random.randint(10 ** 5, 10 ** 7))
+    dividends = {str(ts): {'amount': 0.25, 'date': ts} for ts in timestamps[30::91]}
+    splits = {str(ts): {'date': ts, 'numerator': 2, 'denominator': 1, 'splitRatio': '2:1'}
+              for ts in timestamps[2000::3000]}
+    return {'chart': {'result': [{
+        'meta': {'currency': 'USD', 'symbol': ticker, 'instrumentType': 'EQUITY', 'firstTradeDate': start,
+                 'gmtoffset': -18000, 'timezone': 'EST', 'exchangeTimezoneName': 'America/New_York'},
+        'timestamp': timestamps,
+        'events': {'dividends': dividends, 'splits': splits},
+        'indicators': {'quote': [quote], 'adjclose': [{'adjclose': [c * 0.9 for c in quote['close']]}]},
+    }], 'error': None}}
+
+
+# a YahooFinancials instance that never touches the network, fill its cache with cached()
+def offline_yf(tickers):
+    from yahoofinancials import YahooFinancials, sessions
+    sessions.LastSession, sessions.Crumb, sessions.QueryServer = object(), 'crumb', 'query1'
+    yf = YahooFinancials(tickers)
+    yf.session = None
+    return yf
+
+
+# a session answering every url with the same response content, for benchmarks of requests not in the cache
+class ContentSession:
+    status_code = 200
+
+    def __init__(self, content):
+        self.headers = {}
+        self.content = content
+
+    def get(self, url, **kwargs):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+# arguments of the get_historical_price_data calls benchmarked
+HISTORY_ARGS = ('2000-01-01', '2020-01-01', 'daily')
+
+
+# best time of repeat runs of func, in seconds per call
+def best_of(func, number=1, repeat=5):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+
+def show(name, seconds, baseline=None):
+    speedup = '' if baseline is None else '  %.1fx' % (baseline / seconds)
+    print('  %-40s %10.3f ms%s' % (name, seconds * 1000, speedup))
+
+
+# json decoding of chart responses, text (decode then parse, as before) versus bytes
+# the standard json module is no faster on bytes (0.8x to 1.0x), only orjson is
+def bench_json(files):
+    from yahoofinancials.utils import get_json_decoder
+    payloads = [(os.path.basename(f), open(f, 'rb').read()) for f in files]
+    payloads = payloads or [('synthesized 20y daily chart', json.dumps(chart_payload()).encode())]
+    decoders = [('json bytes', get_json_decoder('json'))]
+    try:
+        decoders.append(('orjson bytes', get_json_decoder('orjson')))
+    except ImportError:
+        print('  orjson is not installed, skipping it')
+    for name, content in payloads:
+        print('%s: %.1f MB' % (name, len(content) / 1e6))
+        baseline = best_of(lambda: json.loads(content.decode('utf-8')))
+        show('json text (decode + loads)', baseline)
+        for decoder_name, decoder in decoders:
+            show(decoder_name, best_of(lambda: decoder(content)), baseline)
+
+
+# cleaning of cached chart responses into per bar dicts versus numpy columns
+def bench_history(files):
+    payloads = [json.load(open(f)) for f in files] or [chart_payload()]
+    yf = offline_yf(['T%d' % i for i in range(len(payloads))])
+    for tick, payload in zip(yf.tickers, payloads):
+        hist_obj = yf._get_hist_obj(*HISTORY_ARGS)
+        yf._cache.put(yf._build_api_url(hist_obj, tick), payload)
+    print('%d ticker(s), %d bars' % (len(payloads), sum(len(p['chart']['result'][0]['timestamp']) for p in payloads)))
+    baseline = best_of(lambda: yf.get_historical_price_data(*HISTORY_ARGS))
+    show('list of dicts', baseline)
+    show('columnar', best_of(lambda: yf.get_historical_price_data(*HISTORY_ARGS, columnar=True)), baseline)
+
+
+# epoch to 'YYYY-MM-DD' conversion, one datetime per timestamp (as before) versus batches
+def bench_dates(files):
+    import datetime
+    from yahoofinancials.dates import format_epoch_dates
+    timestamps = chart_payload()['chart']['result'][0]['timestamp']
+    print('%d timestamps' % len(timestamps))
+    baseline = best_of(lambda: [str((datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=t)).date())
+                                for t in timestamps])
+    show('datetime + timedelta per timestamp', baseline)
+    show('format_epoch_dates list', best_of(lambda: format_epoch_dates(timestamps)), baseline)
+    try:
+        import numpy as np
+    except ImportError:
+        print('  numpy is not installed, skipping it')
+    else:
+        array = np.array(timestamps, dtype=np.int64)
+        show('format_epoch_dates numpy', best_of(lambda: format_epoch_dates(array)), baseline)
+
+
+# epoch to utc date time strings, through local time and US/Eastern (as before) versus directly
+def bench_times(files):
+    import datetime
+    from yahoofinancials.dates import format_epoch_time, format_epoch_times
+
+    def old_format_time(in_time):
+        import pytz
+        form_date_time = datetime.datetime.fromtimestamp(int(in_time)).strftime('%Y-%m-%d %H:%M:%S')
+        date_ = datetime.datetime.strptime(form_date_time.replace(" 0:", " 12:"), '%Y-%m-%d %H:%M:%S')
+        date_eastern = pytz.timezone('US/Eastern').localize(date_, is_dst=False)
+        return date_eastern.astimezone(pytz.utc).strftime('%Y-%m-%d %H:%M:%S %Z%z')
+
+    timestamps = list(range(1672531200, 1704067200, 3600 * 4 + 17))
+    print('%d timestamps' % len(timestamps))
+    baseline = best_of(lambda: [old_format_time(t) for t in timestamps])
+    show('fromtimestamp, strptime, pytz per time', baseline)
+    show('format_epoch_time', best_of(lambda: [format_epoch_time(t) for t in timestamps]), baseline)
+    show('format_epoch_times list', best_of(lambda: format_epoch_times(timestamps)), baseline)
+    try:
+        import numpy as np
+    except ImportError:
+        print('  numpy is not installed, skipping it')
+    else:
+        array = np.array(timestamps, dtype=np.int64)
+        show('format_epoch_times numpy', best_of(lambda: format_epoch_times(array)), baseline)
+
+
+# synthesize a quoteSummary price module with about width fields, raw/fmt numbers and epoch times like yahoo's
+def price_module(width=40):
+    module = {'maxAge': 1, 'currency': 'USD', 'exchangeName': 'NasdaqGS', 'regularMarketTime': 1697659200,
+              'preMarketTime': 1697635800, 'postMarketTime': 1697673600,
+              'regularMarketPrice': {'raw': 178.72, 'fmt': '178.72'}}
+    for i in range(width - len(module)):
+        value = random.uniform(0, 1000)
+        module['field%d' % i] = {'raw': value, 'fmt': '%.2f' % value}
+    return module
+
+
+# single field quote getters, cleaning the whole module per ticker (as before) versus the field alone
+def bench_quote(files):
+    yf = offline_yf(['T%d' % i for i in range(100)])
+    for width in (40, 400):
+        for tick in yf.tickers:
+            data = {'quoteSummary': {'result': [{'price': price_module(width)}], 'error': None}}
+            yf._cache.put(yf._module_url(tick, 'price'), data)
+        print('%d tickers, %d fields in the price module' % (len(yf.tickers), width))
+        baseline = best_of(lambda: {t: (v or {}).get('regularMarketPrice') for t, v in yf.get_stock_price_data().items()})
+        show('get_stock_price_data()[ticker][field]', baseline)
+        show('get_current_price()', best_of(yf.get_current_price), baseline)
+
+
+# synthesize a fundamentals timeseries response with every type of a statement over the given periods
+def timeseries_payload(report_type='income_statement', frequency='annual', periods=4):
+    from yahoofinancials.maps import FUNDAMENTALS_MAP
+    dates = ['%d-12-31' % (2023 - i) for i in range(periods)]
+    result = []
+    for type_name in FUNDAMENTALS_MAP[report_type][frequency]:
+        records = [{'asOfDate': d, 'periodType': '12M', 'reportedValue': {'raw': random.uniform(-1e9, 1e10)}}
+                   for d in dates]
+        result.append({'meta': {'symbol': ['SYN'], 'type': [type_name]}, 'timestamp': [], type_name: records})
+    return {'timeseries': {'result': result, 'error': None}}
+
+
+# twelve statement metrics, a get_financial_stmts call per metric (as before) versus one get_statement_metrics
+def bench_statements(files):
+    metrics = ['netIncome', 'totalRevenue', 'grossProfit', 'costOfRevenue', 'operatingIncome', 'operatingExpense',
+               'pretaxIncome', 'taxProvision', 'interestExpense', 'researchAndDevelopment', 'ebit', 'eBITDA']
+    yf = offline_yf(['T%d' % i for i in range(100)])
+    for tick in yf.tickers:
+        yf._cache.put(yf._fundamentals_url(tick, 'annual', 'income'), timeseries_payload())
+
+    def per_metric():
+        data = {}
+        for metric in metrics:
+            stmts = yf.get_financial_stmts('annual', 'income')['incomeStatementHistory']
+            for tick in yf.tickers:
+                latest = max(stmts[tick], key=lambda period: list(period)[0])
+                data.setdefault(tick, {})[metric] = list(latest.values())[0].get(metric)
+        return data
+
+    print('%d tickers, %d metrics, %d types per statement' % (len(yf.tickers), len(metrics),
+                                                              len(timeseries_payload()['timeseries']['result'])))
+    baseline = best_of(per_metric)
+    show('get_financial_stmts per metric', baseline)
+    show('get_statement_metrics', best_of(lambda: yf.get_statement_metrics('annual', 'income', metrics)), baseline)
+
+
+# fundamentals url building for 10k symbols, from the request config every time (as before) versus templates
+def bench_urls(files):
+    from yahoofinancials.maps import REQUEST_MAP
+    yf = offline_yf(['AAPL'])
+    symbols = ['S%d' % i for i in range(10000)]
+    print('%d symbols' % len(symbols))
+    baseline = best_of(lambda: [yf._build_url(s, REQUEST_MAP['fundamentals'], {}, 'annual', 'income_statement')
+                                for s in symbols])
+    show('built from REQUEST_MAP', baseline)
+    show('from the template', best_of(lambda: [yf._fundamentals_url(s, 'annual', 'income') for s in symbols]), baseline)
+
+
+# cumulative -X importtime of the modules imported by code, best of repeat fresh interpreters, in seconds
+def import_time(code, modules, repeat=5):
+    best = {}
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-X', 'importtime', '-c', code], stderr=subprocess.PIPE,
+                             universal_newlines=True, check=True).stderr
+        for line in out.splitlines():
+            _, cumulative, name = line.split('|')
+            if name.strip() in modules and cumulative.strip().isdigit():
+                seconds = int(cumulative) / 1e6
+                best[name.strip()] = min(seconds, best.get(name.strip(), seconds))
+    return best
+
+
+# cold start, what import yahoofinancials costs, with what it loads on first use shown separately
+def bench_import(files):
+    times = import_time('import yahoofinancials', ['yahoofinancials'])
+    show('import yahoofinancials', times['yahoofinancials'])
+    first_use = import_time('import yahoofinancials.maps as m; m.REQUEST_MAP; import requests, pytz',
+                            ['yahoofinancials.fundamentals_map', 'requests', 'pytz'])
+    for name, seconds in sorted(first_use.items()):
+        show('  first use: ' + name.split('.')[-1], seconds)
+
+
+# memory held by the cleaned prices of one ticker, per bar dicts versus records versus numpy columns,
+# projected to 3,000 tickers of 20 years of daily bars
+def bench_memory(files):
+    payloads = [json.load(open(f)) for f in files] or [chart_payload()]
+    yf = offline_yf(['T%d' % i for i in range(len(payloads))])
+    for tick, payload in zip(yf.tickers, payloads):
+        hist_obj = yf._get_hist_obj(*HISTORY_ARGS)
+        yf._cache.put(yf._build_api_url(hist_obj, tick), payload)
+    bars = sum(len(p['chart']['result'][0]['timestamp']) for p in payloads)
+    projected_bars = 3000 * 20 * 252
+    print('%d ticker(s), %d bars, projected to 3000 tickers x 20y = %d bars' % (len(payloads), bars, projected_bars))
+    layouts = [('list of dicts', {}), ('as_records', {'as_records': True})]
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        print('  numpy is not installed, skipping columnar')
+    else:
+        layouts.append(('columnar', {'columnar': True}))
+    for name, kwargs in layouts:
+        yf.get_historical_price_data(*HISTORY_ARGS, **kwargs)  # warm the date table
+        tracemalloc.start()
+        data = yf.get_historical_price_data(*HISTORY_ARGS, **kwargs)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del data
+        print('  %-40s %10.1f B/bar %10.2f GB projected' % (name, size / bars, size / bars * projected_bars / 1e9))
+
+
+# a screen of the universe, per field getters filtered in python versus the columnar snapshot
+def bench_screen(files):
+    yf = offline_yf(['T%d' % i for i in range(5000)])
+    for tick in yf.tickers:
+        price = {'marketCap': {'raw': random.uniform(1e8, 1e12)}}
+        detail = {'trailingPE': {'raw': random.uniform(5, 40)}, 'payoutRatio': {'raw': random.uniform(0, 1)}}
+        yf._cache.put(yf._module_url(tick, 'price'), {'quoteSummary': {'result': [{'price': price}], 'error': None}})
+        yf._cache.put(yf._module_url(tick, 'summaryDetail'),
+                      {'quoteSummary': {'result': [{'summaryDetail': detail}], 'error': None}})
+    print('%d tickers' % len(yf.tickers))
+
+    def getters():
+        caps, pes, payouts = yf.get_market_cap(), yf.get_pe_ratio(), yf.get_payout_ratio()
+        return [t for t in yf.tickers if caps[t] is not None and caps[t] > 2e9 and pes[t] is not None and pes[t] < 15
+                and payouts[t] is not None and payouts[t] < 0.6]
+
+    conditions = 'marketCap > 2B and trailingPE < 15 and payoutRatio < 0.6'
+    baseline = best_of(getters)
+    show('getters and python filter', baseline)
+    show('screen, loading the snapshot', best_of(lambda: setattr(yf, '_snapshot', None) or yf.screen(conditions)),
+         baseline)
+    show('screen, snapshot loaded', best_of(lambda: yf.screen(conditions)), baseline)
+
+
+# histories of many tickers cleaned on the request threads versus in worker processes, from the raw responses
+def bench_processes(files):
+    payloads = [open(f, 'rb').read() for f in files] or [json.dumps(chart_payload()).encode()]
+    tickers = ['T%d' % i for i in range(32)]
+    processes = os.cpu_count() or 1
+    print('%d tickers, %d bytes per response, %d cpus' % (len(tickers), len(payloads[0]), processes))
+    if processes == 1:
+        print('  a single cpu only measures the cost of sending the responses to the process, run it on several')
+    for columnar in (False, True):
+        name = 'columnar' if columnar else 'dicts'
+        timings = []
+        for kwargs in ({}, {'processes': processes}):
+            yf = offline_yf(tickers)
+            yf.session, yf._MIN_INTERVAL, yf.max_workers = ContentSession(payloads[0]), 0, max(8, processes)
+            yf.processes = kwargs.get('processes')
+            for _ in yf.iter_historical_price_data(*HISTORY_ARGS, columnar=columnar):
+                pass  # starts the worker processes
+            timings.append(best_of(lambda: [h for _, h in yf.iter_historical_price_data(*HISTORY_ARGS,
+                                                                                         columnar=columnar)],
+                                   repeat=3))
+            yf.close()
+        show(name + ', threads', timings[0])
+        show(name + ', %d processes' % processes, timings[1], timings[0])
+
+
+# indicators of a price history, per bar in python versus vectorized, and a new bar recomputed versus updated
+def bench_indicators(files):
+    from yahoofinancials.arrays import PriceArrays
+    from yahoofinancials.indicators import IndicatorSet, SMA, RollingVolatility
+    payloads = [json.load(open(f)) for f in files] or [chart_payload()]
+    prices = PriceArrays.from_chart_result(payloads[0]['chart']['result'][0])
+    print('%d bars' % len(prices))
+    for name, make in (('sma200', lambda: SMA(200)), ('volatility20', lambda: RollingVolatility(20))):
+        baseline = best_of(lambda: [ind.update(h, l, c) for ind in [make()]
+                                    for h, l, c in zip(prices.high, prices.low, prices.close)])
+        show(name + ' per bar', baseline)
+        show(name + ' vectorized', best_of(lambda: make().run(prices.high, prices.low, prices.close)), baseline)
+    indicators = IndicatorSet().run(prices)
+    baseline = best_of(lambda: IndicatorSet().run(prices))
+    show('new bar, all indicators recomputed', baseline)
+    show('new bar, all indicators updated', best_of(lambda: indicators.update(50.0, 49.0, 49.5), number=1000),
+         baseline)
+
+
+BENCHMARKS = {
+    'json': bench_json,
+    'history': bench_history,
+    'dates': bench_dates,
+    'times': bench_times,
+    'memory': bench_memory,
+    'quote': bench_quote,
+    'statements': bench_statements,
+    'urls': bench_urls,
+    'import': bench_import,
+    'indicators': bench_indicators,
+    'screen': bench_screen,
+    'processes': bench_processes,
+}
+
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if [a for a in args if a in ('-h', '--help')]:
+        print(__doc__ % {'scriptname': sys.argv[0], 'benchmarks': ', '.join(BENCHMARKS)})
+        sys.exit(0)
+    files = [a for a in args if os.path.isfile(a)]
+    names = [a for a in args if a in BENCHMARKS] or list(BENCHMARKS)
+    for name in names:
+        print(mark)
+        print(name + ':')
+        BENCHMARKS[name](files)
@@ -24,6 +24,12 @@ setup(
         "pytz",
         "requests>=2.26",
     ],
+    extras_require={
+        "fast": ["orjson"],
+        "numpy": ["numpy"],
+        "pandas": ["pandas"],
+        "arrow": ["numpy", "pyarrow"],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
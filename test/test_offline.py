@@ -0,0 +1,719 @@
+# YahooFinancials Offline Unit Tests
+# These tests run against canned responses and do not need network access.
+
+import datetime
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from unittest import main as t_main, skipIf, TestCase
+
+from yahoofinancials import YahooFinancials as yf
+from yahoofinancials import sessions
+from yahoofinancials.cache import HOT_HITS
+from yahoofinancials.data import DataNotFound, YahooFinanceData
+from yahoofinancials.dates import format_epoch_date, format_epoch_dates, format_epoch_time, format_epoch_times
+from yahoofinancials.fundamentals import FundamentalsMatrix
+from yahoofinancials.maps import REQUEST_MAP
+from yahoofinancials.records import DividendEvent, PriceBar, SplitEvent
+from yahoofinancials.utils import get_json_decoder
+
+
+# Canned response used in place of a requests response
+class FakeResponse:
+
+    def __init__(self, status_code, body):
+        self.status_code = status_code
+        # bytes bodies are sent as they are, e.g. html error pages
+        self.content = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.text = self.content.decode()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+# Canned session, answers urls by the first matching url fragment
+class FakeSession:
+
+    def __init__(self, responses=None):
+        self.headers = {}
+        self.responses = responses or {}
+        self.requested = []
+
+    def get(self, url, **kwargs):
+        self.requested.append(url)
+        for fragment, (status_code, body) in self.responses.items():
+            if fragment in url:
+                return FakeResponse(status_code, body)
+        return FakeResponse(404, {"chart": {"result": None, "error": {
+            "code": "Not Found", "description": "No data found, symbol may be delisted"}}})
+
+
+# Global function to build a YahooFinancials instance on a canned session
+def offline_yf(tickers, responses=None, **kwargs):
+    sessions.LastSession = FakeSession(responses)
+    sessions.Crumb = 'crumb'
+    sessions.QueryServer = 'query1'
+    yahoo_financials = yf(tickers, **kwargs)
+    yahoo_financials._MIN_INTERVAL = 0
+    return yahoo_financials
+
+
+# Global function to build a canned quoteSummary response
+def quote_summary(**modules):
+    return {"quoteSummary": {"result": [modules], "error": None}}
+
+
+# Global function to build a canned v8/finance/chart response
+def chart(timestamps, closes, events=None, volume=1000):
+    quote = {'open': closes, 'high': closes, 'low': closes, 'close': closes, 'volume': [volume] * len(closes)}
+    return {"chart": {"result": [{
+        "meta": {"currency": "USD", "instrumentType": "EQUITY", "firstTradeDate": timestamps[0], "gmtoffset": -18000},
+        "timestamp": timestamps,
+        "events": events or {},
+        "indicators": {"quote": [quote], "adjclose": [{"adjclose": closes}]},
+    }], "error": None}}
+
+
+# Global function to build a canned fundamentals timeseries response from {type: {asOfDate: value}}
+def timeseries(**series):
+    result = []
+    for type_name, values in series.items():
+        result.append({"meta": {"type": [type_name]}, "timestamp": [],
+                       type_name: [{"asOfDate": d, "reportedValue": {"raw": v}} for d, v in values.items()]})
+    return {"timeseries": {"result": result, "error": None}}
+
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import pandas
+except ImportError:
+    pandas = None
+try:
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+NOT_FOUND = (404, {"quoteSummary": {"result": None, "error": {"code": "Not Found",
+                                                             "description": "Quote not found for ticker symbol: BAD"}}})
+
+
+class TestCaching(TestCase):
+
+    def test_response_cache(self):
+        test_yf = offline_yf('C', {'/c?': (200, quote_summary(price={"regularMarketPrice": {"raw": 50.5}}))})
+        self.assertEqual(test_yf.get_current_price(), {'C': 50.5})
+        self.assertEqual(test_yf.get_current_price(), {'C': 50.5})
+        self.assertEqual(len(test_yf.session.requested), 1)
+
+    def test_negative_cache(self):
+        test_yf = offline_yf(['C', 'BAD'], {
+            '/c?': (200, quote_summary(price={"regularMarketPrice": {"raw": 50.5}})),
+            '/bad?': NOT_FOUND,
+        })
+        self.assertEqual(test_yf.get_current_price(), {'C': 50.5, 'BAD': None})
+        self.assertIn('BAD', test_yf.bad_tickers)
+        # known-bad tickers are skipped before any request is made
+        self.assertIsNone(test_yf.get_summary_data()['BAD'])
+        self.assertEqual(len([u for u in test_yf.session.requested if '/bad?' in u]), 1)
+
+    def test_module_not_found(self):
+        # yahoo answers 404 for a module a valid ticker has no data for
+        test_yf = offline_yf('BTC-USD', {
+            'modules=earnings': (404, {"quoteSummary": {"result": None, "error": {
+                "code": "Not Found", "description": "No fundamentals data found for any of the summaryTypes=earnings"}}}),
+            '/btc-usd?': (200, quote_summary(price={"regularMarketPrice": {"raw": 30000.0}})),
+            '/chart/BTC-USD?': (404, b'<html>Not Found</html>'),
+        })
+        self.assertEqual(test_yf.get_stock_earnings_data(), {'BTC-USD': None})
+        self.assertNotIn('BTC-USD', test_yf.bad_tickers)
+        self.assertEqual(test_yf.get_current_price(), {'BTC-USD': 30000.0})
+        # a 404 without json is a permanent error of its url, not a transient one
+        self.assertIsNone(test_yf.get_historical_price_data('2015-01-12', '2015-01-18', 'weekly')['BTC-USD'])
+        url = test_yf._build_api_url(test_yf._get_hist_obj('2015-01-12', '2015-01-18', 'weekly'), 'BTC-USD')
+        self.assertIsInstance(test_yf._cache.get_error(url), DataNotFound)
+        self.assertNotIn('BTC-USD', test_yf.bad_tickers)
+        self.assertEqual(test_yf.get_stock_earnings_data(), {'BTC-USD': None})
+        self.assertEqual(len([u for u in test_yf.session.requested if 'modules=earnings' in u]), 1)
+
+    def test_transient_error_cache(self):
+        test_yf = offline_yf('C', {'/c?': (500, {})})
+        self.assertEqual(test_yf.get_current_price(), {'C': None})
+        self.assertEqual(test_yf.get_current_price(), {'C': None})
+        self.assertEqual(len(test_yf.session.requested), 1)
+        self.assertNotIn('C', test_yf.bad_tickers)
+
+    def test_stale_while_revalidate(self):
+        test_yf = offline_yf('C', {'/c?': (200, quote_summary(price={"regularMarketPrice": {"raw": 50.5}}))},
+                             cache_ttl=0.05, stale_while_revalidate=True)
+        self.assertEqual(test_yf.get_current_price(), {'C': 50.5})
+        test_yf.session.responses['/c?'] = (200, quote_summary(price={"regularMarketPrice": {"raw": 51.0}}))
+        time.sleep(0.1)
+        # expired entries still count as cached, so batched module requests do not refetch them in the foreground
+        for url in list(test_yf._cache._entries):
+            self.assertIn(url, test_yf._cache)
+        # the expired entry is served at once while it is refreshed in the background
+        self.assertEqual(test_yf.get_current_price(), {'C': 50.5})
+        for _ in range(100):
+            if test_yf._cache.refresher.pending() == 0:
+                break
+            time.sleep(0.01)
+        self.assertEqual(test_yf.get_current_price(), {'C': 51.0})
+
+    def test_refresh_ahead(self):
+        # a plain cache_ttl makes no background request
+        test_yf = offline_yf('C', {'/c?': (200, quote_summary(price={"regularMarketPrice": {"raw": 50.5}}))},
+                             cache_ttl=0.05)
+        self.assertIsNone(test_yf._cache.refresher)
+        test_yf = offline_yf('C', {'/c?': (200, quote_summary(price={"regularMarketPrice": {"raw": 50.5}}))},
+                             cache_ttl=0.05, stale_while_revalidate=True, refresh_ahead=None)
+        for _ in range(HOT_HITS):
+            self.assertEqual(test_yf.get_current_price(), {'C': 50.5})
+        time.sleep(0.04)
+        self.assertEqual(test_yf.get_current_price(), {'C': 50.5})
+        self.assertEqual(test_yf._cache.refresher.pending(), 0)
+        self.assertEqual(len(test_yf.session.requested), 1)
+
+    def test_json_decoder(self):
+        for decoder in ('json', None, json.loads):
+            test_yf = offline_yf('C', {'/c?': (200, quote_summary(price={"regularMarketPrice": {"raw": 50.5}}))},
+                                 json_decoder=decoder)
+            self.assertEqual(test_yf.get_current_price(), {'C': 50.5})
+        self.assertIs(get_json_decoder('json'), json.loads)
+        self.assertRaises(ValueError, get_json_decoder, 'simplejson')
+
+    def test_bad_ticker_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'bad_tickers.json')
+            test_yf = offline_yf('BAD', {'/bad?': NOT_FOUND}, bad_ticker_file=path)
+            test_yf.get_current_price()
+            test_yf = offline_yf('BAD', bad_ticker_file=path)
+            self.assertEqual(test_yf.get_current_price(), {'BAD': None})
+            self.assertEqual(test_yf.session.requested, [])
+
+
+class TestImport(TestCase):
+
+    def test_lazy_imports(self):
+        # guards the cold start, these are only loaded on first use
+        lazy = ['requests', 'pytz', 'numpy', 'pandas', 'pyarrow',
+                'yahoofinancials.fundamentals_map']
+        code = 'import sys, yahoofinancials; print(",".join(m for m in %r if m in sys.modules))' % lazy
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        out = subprocess.run([sys.executable, '-c', code], cwd=root, stdout=subprocess.PIPE, check=True,
+                             universal_newlines=True).stdout
+        self.assertEqual(out.strip(), '')
+
+    def test_lazy_maps(self):
+        from yahoofinancials import maps
+        self.assertIs(maps.REQUEST_MAP['fundamentals']['request']['type']['options'], maps.FUNDAMENTALS_MAP)
+        self.assertIn('annualNetIncome', maps.FUNDAMENTALS_MAP['income_statement']['annual'])
+
+
+class TestPrefetch(TestCase):
+
+    def test_prefetch(self):
+        test_yf = offline_yf(['C', 'AAPL', 'BAD'], {
+            '/c?': (200, quote_summary(price={"regularMarketPrice": {"raw": 50.5}},
+                                       summaryDetail={"beta": {"raw": 1.5}})),
+            '/aapl?': (200, quote_summary(price={"regularMarketPrice": {"raw": 150.0}}, summaryDetail={})),
+            '/bad?': NOT_FOUND,
+        }, max_workers=2)
+        progress = []
+        report = test_yf.prefetch(modules=['price', 'summaryDetail'], progress=lambda *args: progress.append(args))
+        self.assertEqual(report['requests'], 3)
+        self.assertEqual(list(report['errors']), ['BAD'])
+        self.assertEqual(len(progress), 3)
+        self.assertEqual(len(test_yf.session.requested), 3)
+        self.assertNotIn('BAD', test_yf.bad_tickers)
+        # one request per ticker for both modules, later getters are served from the cache
+        self.assertEqual(test_yf.get_current_price(), {'C': 50.5, 'AAPL': 150.0, 'BAD': None})
+        self.assertEqual(test_yf.get_beta(), {'C': 1.5, 'AAPL': None, 'BAD': None})
+        self.assertEqual(len(test_yf.session.requested), 3)
+        self.assertIn('BAD', test_yf.bad_tickers)
+        self.assertEqual(test_yf.prefetch(modules=['price', 'summaryDetail'])['requests'], 0)
+
+
+class TestDates(TestCase):
+
+    def test_format_epoch_dates(self):
+        timestamps = list(range(-86400 * 3 - 1, 86400 * 3, 3599)) + [1421038800, 1704067199, 1704067200, 4102444800]
+        expected = [str((datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=t)).date()) for t in timestamps]
+        self.assertEqual(format_epoch_dates(timestamps), expected)
+        self.assertEqual([format_epoch_date(t) for t in timestamps], expected)
+        self.assertEqual(yf.format_date(1421038800), '2015-01-12')
+        if numpy is not None:
+            self.assertEqual(list(format_epoch_dates(numpy.array(timestamps))), expected)
+
+    @skipIf(not hasattr(time, 'tzset'), "time.tzset is not available")
+    def test_format_epoch_time(self):
+        # format_epoch_time replaced formatting the local time and converting it from US/Eastern to UTC,
+        # which gave the utc time on US/Eastern hosts
+        old_tz = os.environ.get('TZ')
+        os.environ['TZ'] = 'US/Eastern'
+        time.tzset()
+        try:
+            # an hour every 61 minutes across 2023, including both dst changes
+            timestamps = range(1672531200, 1704067200, 3660)
+            for t in timestamps:
+                try:
+                    expected = yf._convert_to_utc(datetime.datetime.fromtimestamp(t).strftime('%Y-%m-%d %H:%M:%S'))
+                except Exception:  # the old conversion failed on the ambiguous hour when dst ends
+                    continue
+                self.assertEqual(format_epoch_time(t), expected)
+        finally:
+            if old_tz is None:
+                del os.environ['TZ']
+            else:
+                os.environ['TZ'] = old_tz
+            time.tzset()
+        self.assertEqual(format_epoch_times(list(timestamps)), [format_epoch_time(t) for t in timestamps])
+        if numpy is not None:
+            self.assertEqual(list(format_epoch_times(numpy.array(timestamps))), format_epoch_times(timestamps))
+
+
+class TestHistory(TestCase):
+
+    def setUp(self):
+        # 2015-01-12 and the two following weeks, the second week without data
+        self.test_yf = offline_yf('C', {'/chart/C?': (200, chart([1421038800, 1421643600, 1422248400],
+                                                                 [47.61, None, 48.5]))})
+
+    def test_historical_price(self):
+        prices = self.test_yf.get_historical_price_data('2015-01-12', '2015-02-01', 'weekly')['C']['prices']
+        self.assertEqual(prices[0], {'date': 1421038800, 'high': 47.61, 'low': 47.61, 'open': 47.61, 'close': 47.61,
+                                     'volume': 1000, 'adjclose': 47.61, 'formatted_date': '2015-01-12'})
+        self.assertIsNone(prices[1]['close'])
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_historical_price_columnar(self):
+        prices = self.test_yf.get_historical_price_data('2015-01-12', '2015-02-01', 'weekly')['C']['prices']
+        columns = self.test_yf.get_historical_price_data('2015-01-12', '2015-02-01', 'weekly', columnar=True)
+        columns = columns['C']['prices']
+        self.assertEqual(columns.close.dtype, numpy.float64)
+        self.assertTrue(numpy.isnan(columns.close[1]))
+        self.assertEqual(list(columns.formatted_date), ['2015-01-12', '2015-01-19', '2015-01-26'])
+        self.assertEqual(columns.to_dicts(), prices)
+        self.assertEqual(len(self.test_yf.session.requested), 1)
+        self.assertEqual([bar.to_dict() for bar in columns.bars()], prices)
+
+    def test_historical_price_records(self):
+        events = {'dividends': {'1421643600': {'amount': 0.01, 'date': 1421643600}},
+                  'splits': {'1421038800': {'date': 1421038800, 'numerator': 2, 'denominator': 1, 'splitRatio': '2:1'}},
+                  'earnings': {'1421643600': {'date': 1421643600, 'epsActual': 1.1}}}
+        test_yf = offline_yf('C', {'/chart/C?': (200, chart([1421038800, 1421643600], [47.61, None], events))})
+        hist = test_yf.get_historical_price_data('2015-01-12', '2015-01-25', 'weekly', as_records=True)['C']
+        self.assertEqual(hist['prices'][0], PriceBar(1421038800, 47.61, 47.61, 47.61, 47.61, 1000, 47.61))
+        self.assertEqual(hist['prices'][1].formatted_date, '2015-01-19')
+        self.assertIsNone(hist['prices'][1].close)
+        self.assertFalse(hasattr(hist['prices'][0], '__dict__'))
+        self.assertEqual(hist['eventsData']['dividends'], [DividendEvent(1421643600, 0.01)])
+        self.assertEqual(hist['eventsData']['splits'], [SplitEvent(1421038800, 2, 1, '2:1')])
+        dicts = test_yf.get_historical_price_data('2015-01-12', '2015-01-25', 'weekly')['C']
+        self.assertEqual([bar.to_dict() for bar in hist['prices']], dicts['prices'])
+        # event types without a record class are kept as they are
+        self.assertEqual(hist['eventsData']['earnings'], dicts['eventsData']['earnings'])
+
+    def test_resampled_price(self):
+        # wednesday 2015-01-28 to tuesday 2015-02-03 at 14:30 UTC, across a week and a month boundary
+        timestamps = [1422455400 + day * 86400 for day in (0, 1, 2, 5, 6)]
+        test_yf = offline_yf('C', {'/chart/C?': (200, chart(timestamps, [10.0, 12.0, None, 11.0, 13.0]))})
+        daily = test_yf.get_historical_price_data('2015-01-28', '2015-02-03', 'daily')['C']['prices']
+        weekly = test_yf.get_historical_price_data('2015-01-28', '2015-02-03', 'weekly', resample=True)['C']['prices']
+        monthly = test_yf.get_historical_price_data('2015-01-28', '2015-02-03', 'monthly', resample=True)['C']
+        self.assertEqual(len(daily), 5)
+        self.assertEqual(len(test_yf.session.requested), 1)
+        self.assertEqual(weekly, [
+            {'date': 1422248400, 'high': 12.0, 'low': 10.0, 'open': 10.0, 'close': 12.0, 'volume': 3000,
+             'adjclose': 12.0, 'formatted_date': '2015-01-26'},
+            {'date': 1422853200, 'high': 13.0, 'low': 11.0, 'open': 11.0, 'close': 13.0, 'volume': 2000,
+             'adjclose': 13.0, 'formatted_date': '2015-02-02'},
+        ])
+        self.assertEqual([(bar['formatted_date'], bar['close']) for bar in monthly['prices']],
+                         [('2015-01-01', 12.0), ('2015-02-01', 13.0)])
+        self.assertEqual(monthly['timeZone'], {'gmtOffset': -18000})
+
+    def test_resampled_price_dst(self):
+        # bars at midnight EDT on friday 2015-05-29 and monday 2015-06-01, with the winter gmtoffset of the meta
+        payload = chart([1432872000, 1433131200], [10.0, 11.0])
+        payload['chart']['result'][0]['meta']['exchangeTimezoneName'] = 'America/New_York'
+        test_yf = offline_yf('C', {'/chart/C?': (200, payload)})
+        monthly = test_yf.get_historical_price_data('2015-05-29', '2015-06-01', 'monthly', resample=True)['C']
+        self.assertEqual([(bar['date'], bar['close']) for bar in monthly['prices']],
+                         [(1430452800, 10.0), (1433131200, 11.0)])
+        weekly = test_yf.get_historical_price_data('2015-05-29', '2015-06-01', 'weekly', resample=True)['C']
+        self.assertEqual([bar['formatted_date'] for bar in weekly['prices']], ['2015-05-25', '2015-06-01'])
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_adjusted_price(self):
+        # split adjusted closes as yahoo returns them, a 2:1 split on the last bar and a dividend on the fourth one,
+        # after a bar without a close, so the dividend is 1% of the last close before it (50.5). The adjclose below
+        # is worked out by hand, the comparison with yahoo's own adjclose is test_yf_adjusted_price of the live tests
+        timestamps = [1422455400 + day * 86400 for day in range(6)]
+        closes = [50.0, 50.5, None, 49.25, 50.0, 50.5]
+        events = {'dividends': {str(timestamps[3]): {'amount': 0.505, 'date': timestamps[3]}},
+                  'splits': {str(timestamps[5]): {'date': timestamps[5], 'numerator': 2, 'denominator': 1,
+                                                  'splitRatio': '2:1'}}}
+        response = chart(timestamps, closes, events)
+        adjclose = [49.5, 49.994998931884766, None, 49.25, 50.0, 50.5]
+        response['chart']['result'][0]['indicators']['adjclose'] = [{'adjclose': adjclose}]
+        test_yf = offline_yf('C', {'/chart/C?': (200, response)})
+        prices = test_yf.get_adjusted_price_data('2015-01-28', '2015-02-03', 'daily')['C']['prices']
+        numpy.testing.assert_allclose(prices.close, prices.adjclose, rtol=1e-6)
+        numpy.testing.assert_allclose(prices.high, prices.adjclose, rtol=1e-6)
+        traded = test_yf.get_adjusted_price_data('2015-01-28', '2015-02-03', 'daily', dividends=False,
+                                                 split_adjusted=False)['C']['prices']
+        self.assertEqual(traded.close[[0, 4, 5]].tolist(), [100.0, 100.0, 50.5])
+        self.assertEqual(traded.volume.tolist(), [500.0] * 5 + [1000.0])
+        self.assertEqual(len(test_yf.session.requested), 1)
+
+    def test_events_from_cached_chart(self):
+        events = {'dividends': {'1422248400': {'amount': 0.02, 'date': 1422248400},
+                                '1421643600': {'amount': 0.01, 'date': 1421643600}},
+                  'splits': {'1421038800': {'date': 1421038800, 'numerator': 2, 'denominator': 1, 'splitRatio': '2:1'}}}
+        test_yf = offline_yf(['C', 'BAD'], {'/chart/C?': (200, chart([1421038800, 1421643600, 1422248400],
+                                                                     [47.61, 48.0, 48.5], events))})
+        test_yf.get_historical_price_data('2015-01-12', '2015-02-01', 'weekly')
+        self.assertEqual(test_yf.get_daily_dividend_data('2015-01-13', '2015-02-01'), {
+            'C': [{'date': 1421643600, 'formatted_date': '2015-01-19', 'amount': 0.01},
+                  {'date': 1422248400, 'formatted_date': '2015-01-26', 'amount': 0.02}],
+            'BAD': None})
+        self.assertEqual(test_yf.get_daily_dividend_data('2015-01-20', '2015-01-25'), {'C': None, 'BAD': None})
+        self.assertEqual(test_yf.get_daily_split_data('2015-01-12', '2015-01-18')['C'], [
+            {'date': 1421038800, 'numerator': 2, 'denominator': 1, 'splitRatio': '2:1', 'formatted_date': '2015-01-12'}])
+        self.assertEqual(len([url for url in test_yf.session.requested if '/chart/C?' in url]), 1)
+        # a range the cached chart does not cover is requested
+        self.assertEqual(len(test_yf.get_daily_dividend_data('2014-01-01', '2015-02-01')['C']), 2)
+        self.assertEqual(len([url for url in test_yf.session.requested if '/chart/C?' in url]), 2)
+
+    def test_iter_historical_price(self):
+        test_yf = offline_yf(['C', 'BAD', 'F'], {
+            '/chart/C?': (200, chart([1421038800], [47.61])),
+            '/chart/F?': (200, chart([1421038800], [15.1])),
+        })
+        hist = test_yf.get_historical_price_data('2015-01-12', '2015-01-18', 'weekly')
+        test_yf._cache.clear()
+        pairs = list(test_yf.iter_historical_price_data('2015-01-12', '2015-01-18', 'weekly'))
+        self.assertEqual([tick for tick, _ in pairs], ['C', 'BAD', 'F'])
+        self.assertEqual(dict(pairs), hist)
+        self.assertEqual(len(test_yf._cache), 0)
+        pairs = test_yf.iter_historical_price_data('2015-01-12', '2015-01-18', 'weekly', completion_order=True)
+        self.assertEqual(sorted(tick for tick, _ in pairs), ['BAD', 'C', 'F'])
+
+    def test_iter_historical_price_processes(self):
+        responses = {'/chart/C?': (200, chart([1421038800, 1421643600], [47.61, None])),
+                     '/chart/F?': (200, chart([1421038800], [15.1]))}
+        hist = offline_yf(['C', 'BAD', 'F'], responses).get_historical_price_data('2015-01-12', '2015-01-25', 'weekly')
+        with offline_yf(['C', 'BAD', 'F'], responses, processes=2) as test_yf:
+            self.assertEqual(dict(test_yf.iter_historical_price_data('2015-01-12', '2015-01-25', 'weekly')), hist)
+            self.assertIn('BAD', test_yf.bad_tickers)
+            if numpy is not None:
+                pairs = test_yf.iter_historical_price_data('2015-01-12', '2015-01-25', 'weekly', columnar=True)
+                self.assertEqual(dict(pairs)['C']['prices'].to_dicts(), hist['C']['prices'])
+            # methods cleaning on the request threads say so, once
+            with self.assertLogs(level='WARNING') as logs:
+                self.assertEqual(test_yf.get_historical_price_data('2015-01-12', '2015-01-25', 'weekly'), hist)
+                test_yf.get_historical_price_data('2015-01-12', '2015-01-25', 'weekly')
+            self.assertEqual(len([m for m in logs.output if 'has no effect on get_historical_price_data' in m]), 1)
+        self.assertIsNone(test_yf._process_pool)
+
+    def test_iter_historical_price_processes_errors(self):
+        # an html page and a yahoo error with status 200, handled by the workers as the request threads do
+        responses = {'/chart/X?': (200, b'<html>Will be right back</html>'),
+                     '/chart/BAD?': (200, {"chart": {"result": None, "error": {
+                         "code": "Not Found", "description": "No data found, symbol may be delisted"}}})}
+        hist = offline_yf(['X', 'BAD'], responses).get_historical_price_data('2015-01-12', '2015-01-25', 'weekly')
+        self.assertEqual(hist, {'X': {'eventsData': {}}, 'BAD': None})
+        for decoder in (None, lambda content: json.loads(content)):
+            with offline_yf(['X', 'BAD'], responses, processes=2, json_decoder=decoder) as test_yf:
+                self.assertEqual(dict(test_yf.iter_historical_price_data('2015-01-12', '2015-01-25', 'weekly')), hist)
+                self.assertIn('BAD', test_yf.bad_tickers)
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class TestIndicators(TestCase):
+
+    def test_incremental_indicators(self):
+        from yahoofinancials.indicators import ATR, EMA, RSI, SMA, RollingVolatility
+        close = 50 + numpy.cumsum(numpy.sin(numpy.arange(60.0)))
+        close[[7, 30]] = numpy.nan
+        high, low = close + 1, close - 1.5
+        for make in (lambda: SMA(5), lambda: EMA(5), lambda: RSI(5), lambda: ATR(5), lambda: RollingVolatility(5)):
+            batch = make().run(high, low, close)
+            incremental = make()
+            updates = [incremental.update(h, l, c) for h, l, c in zip(high, low, close)]
+            numpy.testing.assert_allclose(batch, updates, rtol=1e-9)
+            # the state left by run() continues with update()
+            resumed = make()
+            head = resumed.run(high[:40], low[:40], close[:40])
+            tail = [resumed.update(h, l, c) for h, l, c in zip(high[40:], low[40:], close[40:])]
+            numpy.testing.assert_allclose(numpy.concatenate([head, tail]), batch, rtol=1e-9)
+            self.assertTrue(numpy.isnan(batch[[7, 30]]).all())
+        self.assertAlmostEqual(SMA(3).run(high, low, close)[4], numpy.mean(close[[2, 3, 4]]))
+
+    def test_get_indicators(self):
+        closes = [10.0, 11.0, 12.0, 11.0, 13.0]
+        test_yf = offline_yf(['C', 'BAD'], {'/chart/C?': (200, chart([1421038800 + 86400 * i for i in range(5)],
+                                                                    closes))})
+        indicators = test_yf.get_indicators('2015-01-12', '2015-01-17', 'daily', sma=(2,), ema=(), rsi=2, atr=None,
+                                            volatility=None)
+        self.assertIsNone(indicators['BAD'])
+        self.assertEqual(list(indicators['C'].values), ['sma2', 'rsi2'])
+        self.assertEqual(indicators['C'].values['sma2'][1:].tolist(), [10.5, 11.5, 11.5, 12.0])
+        self.assertEqual(indicators['C'].update(14.0, 14.0, 14.0)['sma2'], 13.5)
+        self.assertEqual(indicators['C'].latest()['sma2'], 13.5)
+
+
+class TestQuote(TestCase):
+
+    def test_module_fields(self):
+        test_yf = offline_yf(['C', 'BAD'], {
+            '/c?': (200, quote_summary(price={
+                'regularMarketPrice': {'raw': 47.61, 'fmt': '47.61'}, 'regularMarketTime': 1421038800,
+                'exchangeName': 'NYSE', 'extra': {'raw': 1, 'fmt': '1'}})),
+            '/bad?': NOT_FOUND,
+        })
+        price_data = test_yf.get_stock_price_data()
+        self.assertEqual(test_yf.get_current_price(), {'C': 47.61, 'BAD': None})
+        self.assertEqual(test_yf.get_stock_exchange(), {'C': 'NYSE', 'BAD': None})
+        fields = test_yf.get_module_fields('price', ['regularMarketTime', 'marketCap'])
+        self.assertEqual(fields['C'], {'regularMarketTime': price_data['C']['regularMarketTime'], 'marketCap': None})
+        self.assertIsNone(fields['BAD'])
+        self.assertEqual(test_yf.get_yearly_high(), {'C': None, 'BAD': None})
+
+    def test_get_fields(self):
+        test_yf = offline_yf(['C', 'BAD'], {
+            '/c?': (200, quote_summary(price={'regularMarketPrice': {'raw': 47.61, 'fmt': '47.61'}},
+                                       summaryDetail={'beta': {'raw': 1.5, 'fmt': '1.50'}},
+                                       defaultKeyStatistics={'beta': {'raw': 1.4, 'fmt': '1.40'}})),
+            '/bad?': NOT_FOUND,
+        })
+        table = test_yf.get_fields(['regularMarketPrice', 'beta', 'defaultKeyStatistics.beta', 'returnOnEquity'])
+        self.assertEqual(table.row('C'), {'regularMarketPrice': 47.61, 'beta': 1.5, 'defaultKeyStatistics.beta': 1.4,
+                                          'returnOnEquity': None})
+        self.assertEqual(table.column('beta'), [1.5, None])
+        self.assertEqual(table.to_dict()['BAD'], dict.fromkeys(table.fields))
+        # one combined quoteSummary request per ticker
+        self.assertEqual(len(test_yf.session.requested), 2)
+        self.assertRaises(ValueError, test_yf.get_fields, ['noSuchField'])
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_screen(self):
+        test_yf = offline_yf(['C', 'F', 'BAD'], {
+            '/c?': (200, quote_summary(price={'marketCap': {'raw': 1.0e11}},
+                                       summaryDetail={'trailingPE': {'raw': 10.0}, 'payoutRatio': {'raw': 0.3}})),
+            '/f?': (200, quote_summary(price={'marketCap': {'raw': 5.0e10}}, summaryDetail={'trailingPE': {'raw': 20.0}})),
+            '/bad?': NOT_FOUND,
+        })
+        self.assertEqual(test_yf.screen('marketCap > 2B and trailingPE < 15'), ['C'])
+        self.assertEqual(test_yf.screen([('marketCap', '>=', 5.0e10)]), ['C', 'F'])
+        # missing values meet no condition
+        self.assertEqual(test_yf.screen('payoutRatio < 0.6'), ['C'])
+        self.assertEqual(test_yf.screen('payoutRatio != 0.6'), ['C'])
+        requested = len(test_yf.session.requested)
+        test_yf.screen('marketCap > 2B', max_age=60)
+        self.assertEqual(len(test_yf.session.requested), requested)
+        # a stale column is downloaded again
+        test_yf._snapshot.loaded['marketCap'] -= 120
+        test_yf.screen('marketCap > 2B', max_age=60)
+        self.assertGreater(len(test_yf.session.requested), requested)
+        self.assertRaises(ValueError, test_yf.screen, 'marketCap >> 2B')
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class TestCalcs(TestCase):
+
+    def test_vectorized_calcs(self):
+        from yahoofinancials.calcs import eps, eps_array, num_shares_outstanding, num_shares_outstanding_array
+        prices, pe_ratios = [10.0, None, 5.0, 4.0], [2.0, 3.0, 0.0, None]
+        self.assertEqual(eps_array(prices, pe_ratios)[0], eps(prices[0], pe_ratios[0]))
+        self.assertTrue(numpy.isnan(eps_array(prices, pe_ratios)[1:]).all())
+        shares = num_shares_outstanding_array([100.0, 100.0], [1.0, None], [3.0, 2.0], 'average', [2.0, 2.0])
+        self.assertEqual(shares[0], num_shares_outstanding(100.0, 1.0, 3.0, 'average', 2.0))
+        self.assertTrue(numpy.isnan(shares[1]))
+        shares = num_shares_outstanding_array([100.0, 100.0], [1.0, 1.0], [3.0, 3.0], 'median', [2.0, 2.0])
+        self.assertTrue(numpy.isnan(shares).all())
+
+    def test_derived_metrics(self):
+        test_yf = offline_yf(['C', 'BAD'], {
+            '/c?': (200, quote_summary(
+                price={'regularMarketPrice': {'raw': 50.0}, 'marketCap': {'raw': 1.0e11}},
+                summaryDetail={'trailingPE': {'raw': 10.0}, 'dividendRate': {'raw': 2.0}},
+                financialData={'totalDebt': {'raw': 3.0e10}, 'totalCash': {'raw': 1.0e10}, 'ebitda': {'raw': 2.4e10},
+                               'totalRevenue': {'raw': 8.0e10}, 'grossProfits': {'raw': 4.0e10}})),
+            '/bad?': NOT_FOUND,
+        })
+        metrics = test_yf.get_derived_metrics()
+        self.assertEqual(metrics.row('C'), {'earningsPerShare': 5.0, 'numSharesOutstanding': 2.0e9,
+                                            'enterpriseValue': 1.2e11, 'evToEbitda': 5.0, 'grossMargin': 0.5,
+                                            'ebitdaMargin': 0.3, 'payoutRatio': 0.4})
+        self.assertEqual(set(metrics.row('BAD').values()), {None})
+
+
+class TestFundamentals(TestCase):
+
+    def setUp(self):
+        self.test_yf = offline_yf('C', {'/timeseries/c?': (200, timeseries(
+            annualNetIncome={"2022-12-31": 1.5e10, "2021-12-31": 2.2e10},
+            annualTotalRevenue={"2022-12-31": 7.5e10}))})
+
+    def test_fundamentals_matrix(self):
+        matrix = self.test_yf.get_financial_stmts('annual', 'income', as_matrix=True)['incomeStatementHistory']['C']
+        self.assertEqual(matrix.dates, ['2021-12-31', '2022-12-31'])
+        self.assertIn('netIncome', matrix.fields)
+        self.assertEqual(matrix.fields, sorted(matrix.fields))
+        self.assertEqual(matrix.get('2022-12-31', 'totalRevenue'), 7.5e10)
+        self.assertIsNone(matrix.get('2021-12-31', 'totalRevenue'))
+        self.assertEqual(list(matrix.column('netIncome')), [2.2e10, 1.5e10])
+        stmts = self.test_yf.get_financial_stmts('annual', 'income')['incomeStatementHistory']['C']
+        self.assertEqual(sorted(matrix.to_list(), key=lambda d: list(d)[0]), sorted(stmts, key=lambda d: list(d)[0]))
+        self.test_yf.flat_format = True
+        stmts = self.test_yf.get_financial_stmts('annual', 'income')['incomeStatementHistory']['C']
+        self.assertEqual(matrix.to_dict(), stmts)
+
+    def test_fundamentals_matrix_null_values(self):
+        raw_data = timeseries(annualNetIncome={"2022-12-31": 1.5e10, "2021-12-31": None},
+                              annualTotalRevenue={"2022-12-31": 7.5e10})['timeseries']
+        raw_data['result'][1]['annualTotalRevenue'].append({"asOfDate": "2021-12-31"})
+        matrix = FundamentalsMatrix.from_timeseries(raw_data)
+        # fields yahoo reports without a value are kept as None, as the previous formatter did
+        self.assertEqual(matrix.to_dict(), YahooFinanceData._format_raw_fundamental_data(raw_data))
+        self.assertEqual(matrix.to_dict()['2021-12-31'], {'netIncome': None, 'totalRevenue': None})
+        self.assertIsNone(matrix.get('2021-12-31', 'netIncome'))
+
+    def test_statement_metrics(self):
+        metrics = self.test_yf.get_statement_metrics('annual', 'income', ['netIncome', 'totalRevenue'], periods=2)
+        self.assertEqual(metrics['C'], {'2021-12-31': {'netIncome': 2.2e10, 'totalRevenue': None},
+                                        '2022-12-31': {'netIncome': 1.5e10, 'totalRevenue': 7.5e10}})
+        self.assertEqual(list(self.test_yf.get_statement_metrics('annual', 'income', ['netIncome'])['C']),
+                         ['2022-12-31'])
+        # the latest period, not the first one of the response
+        self.assertEqual(self.test_yf.get_net_income(), {'C': 1.5e10})
+        self.assertEqual(len(self.test_yf.session.requested), 1)
+
+    def test_trailing_series(self):
+        test_yf = offline_yf('C', {'/timeseries/c?': (200, timeseries(
+            annualNetIncome={"2022-12-31": 1.5e10, "2021-12-31": 2.2e10},
+            annualTotalRevenue={"2022-12-31": 7.5e10},
+            trailingNetIncome={"2023-06-30": 1.7e10}))})
+        # the trailing twelve months, dated at the latest quarter end, are not a period of the statement
+        self.assertEqual(test_yf.get_net_income(), {'C': 1.5e10})
+        self.assertEqual(test_yf.get_total_revenue(), {'C': 7.5e10})
+        metrics = test_yf.get_statement_metrics('annual', 'income', ['netIncome', 'totalRevenue'])
+        self.assertEqual(metrics['C'], {'2022-12-31': {'netIncome': 1.5e10, 'totalRevenue': 7.5e10}})
+        matrix = test_yf.get_financial_stmts('annual', 'income', as_matrix=True)['incomeStatementHistory']['C']
+        self.assertEqual(matrix.dates, ['2021-12-31', '2022-12-31'])
+        self.assertEqual(matrix.trailing.get('2023-06-30', 'netIncome'), 1.7e10)
+        test_yf.flat_format = True
+        self.assertEqual(matrix.to_dict(), test_yf.get_financial_stmts('annual', 'income')['incomeStatementHistory']['C'])
+
+    def test_statement_periods(self):
+        matrix = self.test_yf.get_financial_stmts('annual', 'income', as_matrix=True)['incomeStatementHistory']['C']
+        self.assertEqual(matrix.latest(), '2022-12-31')
+        self.assertEqual(matrix.as_of('2022-06-30'), '2021-12-31')
+        self.assertEqual(matrix.as_of(datetime.date(2022, 12, 31)), '2022-12-31')
+        self.assertIsNone(matrix.as_of('2020-01-01'))
+        self.assertEqual(matrix.last(5), ['2021-12-31', '2022-12-31'])
+        self.assertEqual(matrix.last(1, '2022-01-01'), ['2021-12-31'])
+        metrics = self.test_yf.get_statement_metrics('annual', 'income', ['netIncome'], as_of='2022-06-30')
+        self.assertEqual(metrics['C'], {'2021-12-31': {'netIncome': 2.2e10}})
+        # parsed once per cached response
+        again = self.test_yf.get_financial_stmts('annual', 'income', as_matrix=True)['incomeStatementHistory']['C']
+        self.assertIs(again, matrix)
+
+    def test_url_templates(self):
+        config = REQUEST_MAP['fundamentals']
+        for tick in ('C', 'JPY%3DX'):
+            url = self.test_yf._construct_url(tick, config, {}, 'quarterly', 'balance_sheet')
+            self.assertEqual(url, self.test_yf._build_url(tick, config, {}, 'quarterly', 'balance_sheet'))
+            self.assertIn('/timeseries/' + tick.lower() + '?type=quarterly', url)
+        url = self.test_yf._construct_url('C', REQUEST_MAP['quoteSummary'], {}, None, 'price,summaryDetail')
+        self.assertEqual(url, self.test_yf._build_url('C', REQUEST_MAP['quoteSummary'], {}, None, 'price,summaryDetail'))
+
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_fundamentals_matrix_numpy(self):
+        matrix = self.test_yf.get_financial_stmts('annual', 'income', as_matrix=True)['incomeStatementHistory']['C']
+        values = matrix.to_numpy()
+        self.assertEqual(values.shape, (2, len(matrix.fields)))
+        self.assertEqual(values[1, matrix.fields.index('totalRevenue')], 7.5e10)
+        self.assertEqual(numpy.isnan(values).sum(), values.size - 3)
+
+
+@skipIf(pandas is None, "pandas is not installed")
+class TestFrames(TestCase):
+
+    def test_history_frame(self):
+        test_yf = offline_yf(['C', 'F'], {
+            '/chart/C?': (200, chart([1421038800, 1421643600], [47.61, 48.5])),
+            '/chart/F?': (200, chart([1421038800], [15.1])),
+        })
+        frame = test_yf.get_historical_price_data('2015-01-12', '2015-01-25', 'weekly', as_frame=True)
+        self.assertEqual(list(frame.index.names), ['ticker', 'date'])
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(frame.loc[('C', pandas.Timestamp('2015-01-19')), 'close'], 48.5)
+        self.assertEqual(list(frame.loc['F'].index), [pandas.Timestamp('2015-01-12')])
+
+    def test_statement_frame(self):
+        test_yf = offline_yf('C', {'/timeseries/c?': (200, timeseries(
+            annualNetIncome={"2022-12-31": 1.5e10, "2021-12-31": 2.2e10},
+            annualTotalRevenue={"2022-12-31": 7.5e10}))})
+        frame = test_yf.get_financial_stmts('annual', 'income', as_frame=True)['incomeStatementHistory']
+        self.assertEqual(list(frame.loc['C'].index), [pandas.Timestamp('2021-12-31'), pandas.Timestamp('2022-12-31')])
+        self.assertEqual(frame.loc[('C', pandas.Timestamp('2022-12-31')), 'totalRevenue'], 7.5e10)
+        self.assertTrue(numpy.isnan(frame.loc[('C', pandas.Timestamp('2021-12-31')), 'totalRevenue']))
+
+    def test_module_frame(self):
+        test_yf = offline_yf(['C', 'BAD'], {
+            '/c?': (200, quote_summary(summaryDetail={"beta": {"raw": 1.5}, "currency": "USD"})),
+            '/bad?': NOT_FOUND,
+        })
+        frame = test_yf.get_summary_data(as_frame=True)
+        self.assertEqual(list(frame.index), ['C', 'BAD'])
+        self.assertEqual(frame.loc['C', 'beta'], 1.5)
+        self.assertTrue(frame.loc['BAD'].isna().all())
+
+
+@skipIf(pyarrow is None, "pyarrow is not installed")
+class TestExport(TestCase):
+
+    def test_export_history(self):
+        test_yf = offline_yf(['C', 'BAD'], {
+            '/chart/C?': (200, chart([1421038800, 1421643600], [47.61, None])),
+            '/chart/BAD?': NOT_FOUND,
+        })
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'history.parquet')
+            rows = test_yf.export_historical_price_data(path, '2015-01-12', '2015-01-25', 'weekly')
+            table = pyarrow.parquet.read_table(path)
+        self.assertEqual(rows, {'C': 2, 'BAD': 0})
+        self.assertEqual(table.column('close').to_pylist(), [47.61, None])
+        self.assertEqual(table.column('volume').to_pylist(), [1000, 1000])
+        # exported responses are not kept in the cache
+        self.assertEqual(len(test_yf._cache), 0)
+
+    def test_export_fundamentals(self):
+        test_yf = offline_yf(['C', 'F'], {
+            '/timeseries/c?': (200, timeseries(annualNetIncome={"2022-12-31": 1.5e10, "2021-12-31": 2.2e10})),
+            '/timeseries/f?': (200, timeseries(annualTotalRevenue={"2022-12-31": 1.6e11})),
+        })
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'income.arrow')
+            rows = test_yf.export_financial_stmts(path, 'annual', 'income', file_format='arrow')
+            table = pyarrow.ipc.open_file(path).read_all()
+        self.assertEqual(rows, {'C': 2, 'F': 1})
+        # the schema comes from FUNDAMENTALS_MAP, so it is the same for every ticker
+        self.assertIn('researchAndDevelopment', table.column_names)
+        self.assertEqual(table.column('netIncome').to_pylist(), [2.2e10, 1.5e10, None])
+        self.assertEqual(table.column('totalRevenue').to_pylist(), [None, None, 1.6e11])
+
+
+if __name__ == "__main__":
+    t_main()
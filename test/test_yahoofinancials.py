@@ -5,9 +5,14 @@
 # Copyright (c) 2023 Connor Sanders <jecsand@pm.me>
 # MIT License
 
-from unittest import main as t_main, TestCase
+from unittest import main as t_main, skipIf, TestCase
 from yahoofinancials import YahooFinancials as yf
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 # Test Configuration Variables
 stocks = ['AAPL', 'MSFT', 'C', 'IL&FSTRANS.NS']
 currencies = ['EURUSD=X', 'JPY=X', 'GBPUSD=X']
@@ -88,6 +93,19 @@ class TestModule(TestCase):
                           {'date': 552576600, 'formatted_date': '1987-07-06', 'amount': 0.332}]}
         self.assertDictEqual(single_stock_dividend, expected)
 
+    # Adjusted Price Test, against the adjclose computed by yahoo
+    @skipIf(numpy is None, "numpy is not installed")
+    def test_yf_adjusted_price(self):
+        # AAPL went ex-dividend on 2020-08-07 and split 4:1 on 2020-08-31
+        test_yf = yf('AAPL')
+        hist = test_yf.get_adjusted_price_data('2020-07-01', '2020-09-30', 'daily')['AAPL']
+        self.assertEqual(len(hist['eventsData']['dividends']), 1)
+        self.assertEqual(len(hist['eventsData']['splits']), 1)
+        prices = hist['prices']
+        # adjclose also carries the dividends paid after the range, the same factor for every bar of it
+        ratio = prices.close / prices.adjclose
+        numpy.testing.assert_allclose(ratio, ratio[-1], rtol=1e-5)
+
     # Test concurrent functionality of module
     def test_yf_concurrency(self):
         # Multi stock test
@@ -0,0 +1,66 @@
+from .arrays import PriceArrays
+from .records import event_records
+from .utils import import_optional
+
+
+# Private function to get the events of eventsData, cleaned dicts or records, as records sorted by date
+def _events(events_data, type_key):
+    events = (events_data or {}).get(type_key) or []
+    if isinstance(events, dict):
+        return event_records({type_key: events})[type_key]
+    return events
+
+
+# Private function to get the factor of each bar from events, each event multiplying the bars before its index
+def _backward_factors(length, indexes, factors):
+    np = import_optional('numpy', 'numpy')
+    bar_factors = np.ones(length + 1)
+    np.multiply.at(bar_factors, indexes, factors)
+    # the factor of a bar is the product of those of the events after it
+    return np.cumprod(bar_factors[::-1])[::-1][1:]
+
+
+# Global function to get the dividend adjustment factor of each bar, as yahoo computes its adjclose
+# each dividend multiplies the bars before its ex-date by 1 - amount / the last close before the ex-date,
+# dividends before the first bar or without an amount are left out
+def dividend_factors(date, close, dividends):
+    np = import_optional('numpy', 'numpy')
+    dividends = [d for d in dividends if d.amount is not None]
+    indexes = np.searchsorted(date, np.array([d.date for d in dividends], dtype=np.int64))
+    amounts = np.array([d.amount for d in dividends], dtype=np.float64)
+    if not len(close):
+        return np.ones(0)
+    # index of the last bar with a close, on or before each bar
+    last_close = np.maximum.accumulate(np.where(np.isnan(close), -1, np.arange(len(close))))
+    prev_close = np.where(indexes > 0, last_close[np.maximum(indexes - 1, 0)], -1)
+    keep = prev_close >= 0
+    return _backward_factors(len(date), indexes[keep], 1.0 - amounts[keep] / close[prev_close[keep]])
+
+
+# Global function to get the split factor of each bar, the price ratio between the bar and the latest bars
+# each split multiplies the bars before its date by numerator / denominator, e.g. 2 for a 2:1 split
+def split_factors(date, splits):
+    np = import_optional('numpy', 'numpy')
+    splits = [s for s in splits if s.numerator and s.denominator]
+    indexes = np.searchsorted(date, np.array([s.date for s in splits], dtype=np.int64))
+    ratios = np.array([s.numerator / s.denominator for s in splits], dtype=np.float64)
+    return _backward_factors(len(date), indexes, ratios)
+
+
+# Global function to adjust the columns of a PriceArrays for the dividends and splits of its eventsData
+# yahoo's open, high, low and close are split adjusted, not dividend adjusted: dividends=True adjusts them for
+# the dividends, as adjclose is, and split_adjusted=False undoes the split adjustment to get the prices and
+# volume as traded. events_data can be cleaned eventsData or records, adjclose is returned as it is.
+def adjust_prices(prices, events_data, dividends=True, split_adjusted=True):
+    np = import_optional('numpy', 'numpy')
+    price_factors = np.ones(len(prices))
+    volume_factors = price_factors
+    if dividends:
+        price_factors = price_factors * dividend_factors(prices.date, prices.close, _events(events_data, 'dividends'))
+    if not split_adjusted:
+        ratios = split_factors(prices.date, _events(events_data, 'splits'))
+        price_factors = price_factors * ratios
+        volume_factors = 1.0 / ratios
+    return PriceArrays(prices.date, prices.high * price_factors, prices.low * price_factors,
+                       prices.open * price_factors, prices.close * price_factors, prices.volume * volume_factors,
+                       prices.adjclose)
@@ -0,0 +1,70 @@
+from .dates import format_epoch_dates
+from .records import PriceBarView
+from .utils import import_optional
+
+
+# Class holding the historical prices of a chart response as columns of numpy arrays
+class PriceArrays:
+    """
+    date is an int64 array of epoch seconds, the price columns and volume are float64 arrays
+    with NaN where yahoo has null. Columns are attributes or items, i.e. prices.close or
+    prices['close'], and to_dicts() builds the list of per bar dicts of the default output.
+    bars() iterates the rows as PriceBarView objects without copying them out of the columns.
+    """
+
+    COLUMNS = ('date', 'high', 'low', 'open', 'close', 'volume', 'adjclose')
+
+    def __init__(self, date, high, low, open, close, volume, adjclose):
+        self.date = date
+        self.high = high
+        self.low = low
+        self.open = open
+        self.close = close
+        self.volume = volume
+        self.adjclose = adjclose
+        self._formatted_date = None
+
+    @classmethod
+    def from_chart_result(cls, result):
+        np = import_optional('numpy', 'numpy')
+        quote = result['indicators']['quote'][0]
+        return cls(
+            np.array(result['timestamp'], dtype=np.int64),
+            np.array(quote['high'], dtype=np.float64),
+            np.array(quote['low'], dtype=np.float64),
+            np.array(quote['open'], dtype=np.float64),
+            np.array(quote['close'], dtype=np.float64),
+            np.array(quote['volume'], dtype=np.float64),
+            np.array(result['indicators']['adjclose'][0]['adjclose'], dtype=np.float64),
+        )
+
+    def __len__(self):
+        return len(self.date)
+
+    def __getitem__(self, column):
+        if column == 'formatted_date':
+            return self.formatted_date
+        if column not in self.COLUMNS:
+            raise KeyError(column)
+        return getattr(self, column)
+
+    def __repr__(self):
+        return f"<PriceArrays of {len(self)} bars>"
+
+    # 'YYYY-MM-DD' dates of the bars, computed on first use
+    @property
+    def formatted_date(self):
+        if self._formatted_date is None:
+            self._formatted_date = format_epoch_dates(self.date)
+        return self._formatted_date
+
+    def bars(self):
+        for i in range(len(self)):
+            yield PriceBarView(self, i)
+
+    def to_dicts(self):
+        columns = [[None if v != v else v for v in getattr(self, c).tolist()] for c in self.COLUMNS]
+        columns[5] = [None if v is None else int(v) for v in columns[5]]
+        columns.append(self.formatted_date.tolist())
+        keys = self.COLUMNS + ('formatted_date',)
+        return [dict(zip(keys, bar)) for bar in zip(*columns)]
@@ -0,0 +1,72 @@
+import datetime
+
+from .utils import import_optional
+
+# Price columns of the history schema, volume is stored as int64
+HISTORY_COLUMNS = ('open', 'high', 'low', 'close', 'volume', 'adjclose')
+
+
+def history_schema():
+    pa = import_optional('pyarrow', 'arrow')
+    return pa.schema(
+        [('ticker', pa.string()), ('date', pa.timestamp('s', tz='UTC'))]
+        + [(c, pa.int64() if c == 'volume' else pa.float64()) for c in HISTORY_COLUMNS]
+    )
+
+
+def fundamentals_schema(fields):
+    pa = import_optional('pyarrow', 'arrow')
+    return pa.schema([('ticker', pa.string()), ('date', pa.date32())] + [(f, pa.float64()) for f in fields])
+
+
+# Global function to build the record batch of the PriceArrays of a ticker
+def history_record_batch(ticker, prices, schema):
+    pa = import_optional('pyarrow', 'arrow')
+    columns = [pa.array([ticker] * len(prices), type=pa.string()), pa.array(prices.date, type=schema.field('date').type)]
+    for c in HISTORY_COLUMNS:
+        columns.append(pa.array(prices[c], type=schema.field(c).type, from_pandas=True))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+# Global function to build the record batch of the {asOfDate: {field: value}} fundamentals of a ticker
+def fundamentals_record_batch(ticker, data, schema):
+    pa = import_optional('pyarrow', 'arrow')
+    dates = sorted(data)
+    columns = [
+        pa.array([ticker] * len(dates), type=pa.string()),
+        pa.array([datetime.date.fromisoformat(d) for d in dates], type=pa.date32()),
+    ]
+    for field in schema.names[2:]:
+        columns.append(pa.array([data[d].get(field) for d in dates], type=pa.float64()))
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+# Class used to write record batches one at a time to a parquet or arrow ipc file
+class BatchWriter:
+
+    FORMATS = ('parquet', 'arrow')
+
+    def __init__(self, path, schema, file_format='parquet'):
+        if file_format not in self.FORMATS:
+            raise ValueError("invalid file format: " + str(file_format))
+        if file_format == 'parquet':
+            pq = import_optional('pyarrow.parquet', 'arrow')
+            self._writer = pq.ParquetWriter(path, schema)
+        else:
+            pa = import_optional('pyarrow', 'arrow')
+            self._writer = pa.ipc.new_file(path, schema)
+        self.rows = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+        return False
+
+    def write(self, batch):
+        self._writer.write_batch(batch)
+        self.rows += batch.num_rows
+
+    def close(self):
+        self._writer.close()
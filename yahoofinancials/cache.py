@@ -0,0 +1,218 @@
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+
+# Default expiry, in seconds, for cached errors
+ERROR_TTL = 60
+NOT_FOUND_TTL = 24 * 60 * 60
+BAD_TICKER_TTL = 7 * 24 * 60 * 60
+
+# Fraction of the ttl after which hot entries are refreshed ahead of expiry
+REFRESH_AHEAD = 0.75
+# Number of reads within its lifetime that makes an entry hot
+HOT_HITS = 3
+
+
+# Class used to cache decoded responses and request errors by url
+class ResponseCache:
+    """
+    Responses are kept until ttl seconds have passed (forever if ttl is None).
+    Errors are cached as well so a failing url is not requested again right away:
+    permanent errors (unknown ticker, no data) for not_found_ttl seconds and
+    transient errors (throttling, server or connection errors) for error_ttl seconds.
+
+    With stale_while_revalidate and a refresher, expired entries are still returned
+    and handed to the refresher to be fetched again in the background. Hot entries,
+    read at least HOT_HITS times, are handed over once refresh_ahead of their ttl has
+    passed so they are refreshed before they expire, unless refresh_ahead is None.
+    """
+
+    def __init__(self, ttl=None, error_ttl=ERROR_TTL, not_found_ttl=NOT_FOUND_TTL,
+                 stale_while_revalidate=False, refresh_ahead=REFRESH_AHEAD, refresher=None):
+        self.ttl = ttl
+        self.error_ttl = error_ttl
+        self.not_found_ttl = not_found_ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.refresh_ahead = refresh_ahead
+        self.refresher = refresher
+        self._entries = {}
+        self._errors = {}
+        # guards the read counts, get() is called from the request threads
+        self._lock = threading.Lock()
+
+    # entries get() returns, i.e. fresh ones and, with stale_while_revalidate, expired ones being revalidated
+    def __contains__(self, url):
+        entry = self._entries.get(url)
+        return entry is not None and self._servable(time.time() - entry[0])
+
+    def _servable(self, age):
+        return (self.ttl is None or age <= self.ttl
+                or (self.stale_while_revalidate and self.refresher is not None))
+
+    # hot entries are refreshed before they expire only with stale_while_revalidate and a refresh_ahead
+    def _refreshes_ahead(self):
+        return self.stale_while_revalidate and self.refresher is not None and self.refresh_ahead is not None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def keys(self):
+        return self._entries.keys()
+
+    def clear(self):
+        self._entries.clear()
+        self._errors.clear()
+
+    def pop(self, url):
+        entry = self._entries.pop(url, None)
+        return None if entry is None else entry[1]
+
+    def get(self, url):
+        entry = self._entries.get(url)
+        if entry is None:
+            return None
+        if self.ttl is None:
+            return entry[1]
+        with self._lock:
+            entry[2] += 1
+            hits = entry[2]
+        age = time.time() - entry[0]
+        if age > self.ttl:
+            if not self._servable(age):
+                return None
+            self.refresher.schedule(url)
+        elif self._refreshes_ahead() and hits >= HOT_HITS and age > self.ttl * self.refresh_ahead:
+            self.refresher.schedule(url)
+        return entry[1]
+
+    def put(self, url, data):
+        self._entries[url] = [time.time(), data, 0]
+        self._errors.pop(url, None)
+
+    def get_error(self, url):
+        entry = self._errors.get(url)
+        if entry is None:
+            return None
+        if time.time() > entry[0]:
+            self._errors.pop(url, None)
+            return None
+        return entry[1]
+
+    def put_error(self, url, error, permanent=False):
+        ttl = self.not_found_ttl if permanent else self.error_ttl
+        if ttl:
+            self._errors[url] = (time.time() + ttl, error)
+
+
+# Class used to refetch cache entries on a background thread
+class BackgroundRefresher:
+    """
+    Urls are refetched one at a time with fetch(url), which is expected to store the
+    new response in the cache. The worker thread exits after idle_timeout seconds
+    without work and is restarted by the next schedule().
+    """
+
+    def __init__(self, fetch, idle_timeout=30):
+        self._fetch = fetch
+        self.idle_timeout = idle_timeout
+        self._queue = queue.Queue()
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def schedule(self, url):
+        with self._lock:
+            if url in self._pending:
+                return
+            self._pending.add(url)
+            self._queue.put(url)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="yahoofinancials-refresh", daemon=True)
+                self._thread.start()
+
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def _run(self):
+        while True:
+            try:
+                url = self._queue.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return
+                continue
+            try:
+                self._fetch(url)
+            except Exception as e:
+                logging.debug("yahoofinancials background refresh failed for %s - %s", url, str(e))
+            finally:
+                with self._lock:
+                    self._pending.discard(url)
+
+
+# Class used to remember tickers yahoo does not know, optionally persisted to a json file
+class BadTickerRegistry:
+
+    def __init__(self, path=None, ttl=BAD_TICKER_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._tickers = self._load()
+
+    def __contains__(self, ticker):
+        entry = self._tickers.get(ticker)
+        if entry is None:
+            return False
+        if self.ttl is not None and time.time() - entry['time'] > self.ttl:
+            self.discard(ticker)
+            return False
+        return True
+
+    def __len__(self):
+        return len(self._tickers)
+
+    def __iter__(self):
+        return iter(list(self._tickers))
+
+    def reason(self, ticker):
+        return self._tickers.get(ticker, {}).get('reason') if ticker in self else None
+
+    def add(self, ticker, reason=''):
+        with self._lock:
+            self._tickers[ticker] = {'reason': reason, 'time': time.time()}
+            self._save()
+
+    def discard(self, ticker):
+        with self._lock:
+            if self._tickers.pop(ticker, None) is not None:
+                self._save()
+
+    def clear(self):
+        with self._lock:
+            self._tickers.clear()
+            self._save()
+
+    def _load(self):
+        if not self.path:
+            return {}
+        try:
+            with open(self.path) as f:
+                tickers = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return tickers if isinstance(tickers, dict) else {}
+
+    def _save(self):
+        if not self.path:
+            return
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self._tickers, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
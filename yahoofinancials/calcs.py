@@ -1,3 +1,6 @@
+from .utils import import_optional
+
+
 def eps(price_data, pe_ratio):
     if price_data is not None and pe_ratio is not None:
         return price_data / pe_ratio
@@ -20,3 +23,50 @@ def num_shares_outstanding(cur_market_cap, today_low, today_high, price_type, cu
         return cur_market_cap / today_average
     else:
         return None
+
+
+# Vectorized versions of the calculations, over a whole universe at once
+# inputs are sequences or numpy arrays aligned by ticker, None and missing values are NaN, as are the results
+# of a division by zero or of an invalid price_type
+
+
+def to_array(values):
+    np = import_optional('numpy', 'numpy')
+    return np.asarray(values, dtype=np.float64)
+
+
+def _ratio(numerator, denominator):
+    np = import_optional('numpy', 'numpy')
+    numerator, denominator = to_array(numerator), to_array(denominator)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(denominator != 0, numerator / denominator, np.nan)
+
+
+def eps_array(price_data, pe_ratio):
+    return _ratio(price_data, pe_ratio)
+
+
+def num_shares_outstanding_array(cur_market_cap, today_low, today_high, price_type, current):
+    if price_type == 'current':
+        today_average = to_array(current)
+    elif price_type == 'average':
+        today_average = (to_array(today_low) + to_array(today_high)) / 2
+    else:
+        today_average = to_array(current) * float('nan')
+    return _ratio(cur_market_cap, today_average)
+
+
+def enterprise_value(market_cap, total_debt, total_cash):
+    return to_array(market_cap) + to_array(total_debt) - to_array(total_cash)
+
+
+def margin(amount, total_revenue):
+    return _ratio(amount, total_revenue)
+
+
+def payout_ratio(dividend_rate, eps):
+    return _ratio(dividend_rate, eps)
+
+
+def ev_to_ebitda(ev, ebitda):
+    return _ratio(ev, ebitda)
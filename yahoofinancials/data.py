@@ -1,14 +1,24 @@
 import calendar
 import datetime
+import itertools
 import logging
 import random
+import threading
 import time
-from json import loads
-import pytz
-
-from .maps import COUNTRY_MAP, REQUEST_MAP
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from . import maps
+from .arrays import PriceArrays
+from .cache import (ResponseCache, BackgroundRefresher, BadTickerRegistry,
+                    ERROR_TTL, NOT_FOUND_TTL, BAD_TICKER_TTL, REFRESH_AHEAD)
+from .dates import format_epoch_date, format_epoch_dates, format_epoch_time, get_timezone
+from .fundamentals import FundamentalsMatrix, fundamentals_fields
+from .maps import COUNTRY_MAP
+from .records import EventIndex, PriceBar, event_records, price_bars
+from .resample import RESAMPLE_INTERVALS, resample_chart_result
 from .sessions import init_session
-from .utils import remove_prefix, get_request_config, get_request_category
+from .utils import clean_fundamental_key, get_request_config, get_request_category, get_json_decoder
 
 
 # Custom Exception class to handle custom error
@@ -16,6 +26,37 @@ class ManagedException(Exception):
     pass
 
 
+# Custom Exception class for permanent errors of a url, i.e. yahoo has no such data, e.g. a module of a ticker
+class DataNotFound(ManagedException):
+    pass
+
+
+# Custom Exception class for permanent errors of a ticker, i.e. unknown or delisted tickers
+class TickerNotFound(DataNotFound):
+    pass
+
+
+# descriptions, lowercase, of the yahoo Not Found errors about the ticker itself rather than the data asked for
+TICKER_NOT_FOUND_ERRORS = ("symbol may be delisted", "quote not found for ticker symbol")
+
+
+# Global function to get the exception of a response, None if it has data
+# data is the decoded response, None if it could not be decoded, decode_error the ValueError it raised.
+# Not Found errors are DataNotFound, or TickerNotFound when yahoo tells the ticker is unknown or delisted.
+def response_exception(status_code, data, url, decode_error=None):
+    yahoo_error = YahooFinanceData._response_error(data)
+    if status_code == 404 or (yahoo_error and yahoo_error.get("code") == "Not Found"):
+        description = (yahoo_error or {}).get("description") or "Not Found"
+        if any(e in description.lower() for e in TICKER_NOT_FOUND_ERRORS):
+            return TickerNotFound(f"{description} while opening the url: {url}")
+        return DataNotFound(f"{description} while opening the url: {url}")
+    if decode_error is not None:
+        return ManagedException(f"Request failed with {decode_error!r} while opening the url: {url}")
+    if status_code != 200 or yahoo_error:
+        return ManagedException(f"Server replied with server HTTP error code {status_code} while opening the url: {url}")
+    return None
+
+
 # Class used to get data from urls
 class UrlOpener:
 
@@ -34,6 +75,8 @@ class UrlOpener:
 
     # as list to be updated by instances
     _lastget = [0]
+    # shared by instances so threads take turns
+    _lock = threading.Lock()
 
     def __init__(self, session, min_interval=7):
         self._session = session
@@ -42,12 +85,16 @@ class UrlOpener:
 
     def open(self, url, params=None, proxy=None, timeout=30):
         # be nice and don't bother yahoo by asking too often
-        now = time.time()
-        delta = now - self._lastget[0]
-        if delta < self._min_interval:
-            time.sleep(self._min_interval - delta + min(1, self._min_interval))
+        # reserve the next slot while locked, then wait for it unlocked
+        with self._lock:
             now = time.time()
-        self._lastget[0] = now
+            delta = now - self._lastget[0]
+            if delta < self._min_interval:
+                now += self._min_interval - delta + min(1, self._min_interval)
+            self._lastget[0] = now
+        delay = now - time.time()
+        if delay > 0:
+            time.sleep(delay)
         with self._session.get(
                     url=url,
                     params=params,
@@ -55,7 +102,8 @@ class UrlOpener:
                     timeout=timeout,
                 ) as response:
             self.status_code = response.status_code
-            self.text = response.text
+            # raw bytes, left for the json decoder to decode
+            self.content = response.content
 
 
 class YahooFinanceData(object):
@@ -67,15 +115,43 @@ class YahooFinanceData(object):
         if self.country.upper() not in COUNTRY_MAP.keys():
             raise ReferenceError("invalid country: " + self.country)
         self.max_workers = kwargs.get("max_workers", 8)
+        self.processes = kwargs.get("processes")
+        self._process_pool = None
+        # methods already warned that processes has no effect on them
+        self._processes_warned = set()
         self.timeout = kwargs.get("timeout", 30)
         self.proxies = kwargs.get("proxies")
         self.flat_format = kwargs.get("flat_format", False)
-        self._cache = {}
+        self._json_loads = get_json_decoder(kwargs.get("json_decoder"))
+        self._cache = ResponseCache(
+            ttl=kwargs.get("cache_ttl"),
+            error_ttl=kwargs.get("error_ttl", ERROR_TTL),
+            not_found_ttl=kwargs.get("not_found_ttl", NOT_FOUND_TTL),
+            stale_while_revalidate=kwargs.get("stale_while_revalidate", False),
+            refresh_ahead=kwargs.get("refresh_ahead", REFRESH_AHEAD),
+        )
+        # background requests only for callers asking for them
+        if self._cache.ttl is not None and self._cache.stale_while_revalidate:
+            self._cache.refresher = BackgroundRefresher(lambda url: self._fetch(url, refresh=True))
+        self._matrices = {}
+        # {ticker: {chart url: (start, end)}} of the chart requests, to find cached events covering a range
+        self._chart_ranges = {}
+        self._event_indexes = {}
+        # Snapshot of the quoteSummary fields screened by YahooFinancials.screen()
+        self._snapshot = None
+        self.bad_tickers = BadTickerRegistry(
+            kwargs.get("bad_ticker_file"),
+            ttl=kwargs.get("bad_ticker_ttl", BAD_TICKER_TTL),
+        )
         self.session, self.crumb, self.queryserver = init_session(kwargs.pop("session", None), **kwargs)
 
     # Minimum interval between Yahoo Finance requests for this instance
     _MIN_INTERVAL = 7
 
+    # Placeholder of the symbol in request url templates, and the templates by endpoint, type, frequency and country
+    _SYMBOL = "{symbol}"
+    _URL_TEMPLATES = {}
+
     # Meta-data dictionaries for the classes to use
     YAHOO_FINANCIAL_TYPES = {
         'income': [
@@ -128,14 +204,14 @@ class YahooFinanceData(object):
         if isinstance(in_date, str):
             form_date = int(calendar.timegm(time.strptime(in_date, '%Y-%m-%d')))
         else:
-            form_date = str((datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=in_date)).date())
+            form_date = format_epoch_date(in_date)
         return form_date
 
     # Private Static Method to Convert Eastern Time to UTC
     @staticmethod
     def _convert_to_utc(date, mask='%Y-%m-%d %H:%M:%S'):
-        utc = pytz.utc
-        eastern = pytz.timezone('US/Eastern')
+        utc = get_timezone('UTC')
+        eastern = get_timezone('US/Eastern')
         date_ = datetime.datetime.strptime(date.replace(" 0:", " 12:"), mask)
         date_eastern = eastern.localize(date_, is_dst=None)
         date_utc = date_eastern.astimezone(utc)
@@ -150,14 +226,26 @@ class YahooFinanceData(object):
             return {"https": proxy_str}
         return None
 
-    # Private method to construct historical data url
+    # Private method to construct historical data url, from a template built once per endpoint, type and frequency
     def _construct_url(self, symbol, config, params, freq, request_type):
-        url = config["path"].replace("{symbol}", symbol.lower())
+        if params:
+            return self._build_url(symbol, config, params, freq, request_type)
+        key = (config["path"], request_type, freq, self.country.upper())
+        template = self._URL_TEMPLATES.get(key)
+        if template is None:
+            # split at the symbol, so the url is a join rather than a search of the long type lists
+            template = self._build_url(self._SYMBOL, config, {}, freq, request_type).split(self._SYMBOL)
+            self._URL_TEMPLATES[key] = template
+        return symbol.lower().join(template)
+
+    # Private method to build a url from the request config, the query parameters and the country defaults
+    def _build_url(self, symbol, config, params, freq, request_type):
+        url = config["path"].replace(self._SYMBOL, symbol.lower())
         _default_query_params = COUNTRY_MAP.get(self.country.upper())
         for k, v in config['request'].items():  # request type defaults
             if k == "type":
                 params.update({k: v['options'][request_type].get(freq)})
-            elif k == "modules" and request_type in v['options']:
+            elif k == "modules" and all(m in v['options'] for m in request_type.split(",")):
                 params.update({k: request_type})
             elif k == "symbol":
                 params.update({k: symbol.lower()})
@@ -171,34 +259,146 @@ class YahooFinanceData(object):
             if k not in params:
                 params.update({k: v})
         if params.get("type"):
-            field_params = "%2C".join(params.get("type"))
-            url += "?type=" + field_params
-            for k, v in params.items():
-                if k != "type":
-                    url += "&" + k + "=" + str(v)
+            query = ["type=" + "%2C".join(params.get("type"))]
+            query.extend(k + "=" + str(v) for k, v in params.items() if k != "type")
         elif params.get("modules"):
-            url += "?modules=" + params.get("modules")
-            for k, v in params.items():
-                if k != "modules":
-                    url += "&" + k + "=" + str(v)
+            query = ["modules=" + params.get("modules")]
+            query.extend(k + "=" + str(v) for k, v in params.items() if k != "modules")
         elif params.get("symbol"):
-            url += "?symbol=" + params.get("symbol")
-        return url
+            query = ["symbol=" + params.get("symbol")]
+        else:
+            return url
+        return url + "?" + "&".join(query)
 
-    # Private method to execute a web scrape request
-    def _request_handler(self, url, res_field=""):
-        if self._cache.get(url):
-            return self._cache[url]
+    # Private static method to find the error object of a yahoo response without results
+    @staticmethod
+    def _response_error(data):
+        if isinstance(data, dict):
+            for v in data.values():
+                if isinstance(v, dict) and v.get("error") and not v.get("result"):
+                    return v["error"]
+        return None
+
+    # Private method to request a url, returns the url requested and the status code and raw content of the response
+    def _open_url(self, url):
         cur_url = url
         if not "&crumb=" in cur_url:
             cur_url += "&crumb=" + self.crumb
         urlopener = UrlOpener(self.session, min_interval=self._MIN_INTERVAL)
-        urlopener.open(cur_url, proxy=self._get_proxy(), timeout=self.timeout)
-        if urlopener.status_code != 200:
-            raise ManagedException(
-                f"Server replied with server HTTP error code {response.status_code} while opening the url: {cur_url}")
-        self._cache[url] = loads(urlopener.text).get(res_field)
-        return self._cache[url]
+        try:
+            urlopener.open(cur_url, proxy=self._get_proxy(), timeout=self.timeout)
+        except OSError as e:  # requests exceptions are OSErrors
+            error = ManagedException(f"Request failed with {e!r} while opening the url: {cur_url}")
+            self._cache.put_error(url, error)
+            raise error
+        return cur_url, urlopener.status_code, urlopener.content
+
+    # Private method to decode the content of a response, returns the data and the error it raised
+    def _decode(self, content):
+        try:
+            return self._json_loads(content), None
+        except ValueError as e:  # bad json is a ValueError
+            return None, e
+
+    # Private method to cache and raise the exception of a response, if any
+    def _raise_response_error(self, url, status_code, data, cur_url, decode_error=None):
+        error = response_exception(status_code, data, cur_url, decode_error)
+        if error is not None:
+            self._cache.put_error(url, error, permanent=isinstance(error, DataNotFound))
+            raise error
+
+    # Private method to fetch the raw content of a url, without decoding nor caching it, used by process mode
+    # only errors are cached, responses with a status other than 200 are decoded here to classify their error
+    def _fetch_content(self, url):
+        error = self._cache.get_error(url)
+        if error is not None:
+            raise type(error)(*error.args)
+        cur_url, status_code, content = self._open_url(url)
+        if status_code != 200:
+            data, decode_error = self._decode(content) if status_code == 404 else (None, None)
+            self._raise_response_error(url, status_code, data, cur_url, decode_error)
+        return content
+
+    # Private method to fetch and decode a url, results and errors are cached
+    def _fetch(self, url, refresh=False):
+        if not refresh:
+            data = self._cache.get(url)
+            if data is not None:
+                return data
+            error = self._cache.get_error(url)
+            if error is not None:
+                raise type(error)(*error.args)
+        cur_url, status_code, content = self._open_url(url)
+        data, decode_error = self._decode(content) if status_code in (200, 404) else (None, None)
+        self._raise_response_error(url, status_code, data, cur_url, decode_error)
+        self._cache.put(url, data)
+        return data
+
+    # Private method to build the quoteSummary url of one module, or of several comma separated modules
+    def _module_url(self, up_ticker, modules):
+        return self._construct_url(up_ticker.lower(), maps.REQUEST_MAP['quoteSummary'], {}, None, modules)
+
+    # Private method to fetch several quoteSummary modules with a single request, cached per module
+    def _fetch_modules(self, up_ticker, modules):
+        urls = {m: self._module_url(up_ticker, m) for m in modules}
+        missing = [m for m in modules if urls[m] not in self._cache]
+        if len(missing) == 1:
+            self._fetch(urls[missing[0]])
+        elif missing:
+            try:
+                data = self._fetch(self._module_url(up_ticker, ",".join(missing)))
+            except DataNotFound as e:
+                # an unknown ticker, or none of the modules with data, is the error of each module
+                for m in missing:
+                    self._cache.put_error(urls[m], e, permanent=True)
+                raise
+            results = data.get("quoteSummary", {}).get("result") or [{}]
+            for m in missing:
+                # modules without data are left out of the response, cached as such
+                module = {m: results[0][m]} if m in results[0] else {}
+                self._cache.put(urls[m], {"quoteSummary": {"result": [module], "error": None}})
+        return urls
+
+    # Private method to get the raw quoteSummary module of a ticker, straight from the cached response
+    def _get_raw_module(self, up_ticker, module):
+        data = self._fetch(self._module_url(up_ticker, module))
+        results = data.get("quoteSummary", {}).get("result") or [{}]
+        return results[0].get(module)
+
+    # Private method to build the fundamentals timeseries url of a statement type
+    def _fundamentals_url(self, up_ticker, frequency, statement_type):
+        r_cat = get_request_category('', self.YAHOO_FINANCIAL_TYPES, statement_type)
+        return self._construct_url(up_ticker.lower(), maps.REQUEST_MAP['fundamentals'], {}, frequency, r_cat)
+
+    # Private method to run func over items on a thread pool, yields (item, result, error) as each finishes
+    # at most twice max_workers items are in flight, when ordered items are yielded in input order
+    def _run_concurrent(self, func, items, ordered=False):
+        items = iter(items)
+        workers = max(1, self.max_workers)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = OrderedDict((executor.submit(func, i), i) for i in itertools.islice(items, 2 * workers))
+            try:
+                while pending:
+                    if ordered:
+                        done = [next(iter(pending))]
+                    else:
+                        done = wait(list(pending), return_when=FIRST_COMPLETED).done
+                    for future in done:
+                        item = pending.pop(future)
+                        try:
+                            result, error = future.result(), None
+                        except ManagedException as e:
+                            result, error = None, e
+                        for i in itertools.islice(items, 1):
+                            pending[executor.submit(func, i)] = i
+                        yield item, result, error
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    # Private method to execute a web scrape request
+    def _request_handler(self, url, res_field=""):
+        return self._fetch(url).get(res_field)
 
     @staticmethod
     def _format_raw_fundamental_data(raw_data):
@@ -206,11 +406,7 @@ class YahooFinanceData(object):
         for i in raw_data.get("result"):
             for k, v in i.items():
                 if k not in ['meta', 'timestamp']:
-                    cleaned_k = remove_prefix(remove_prefix(remove_prefix(k, "quarterly"), "annual"), "trailing")
-                    if cleaned_k in ['EBIT']:
-                        cleaned_k = cleaned_k.lower()
-                    else:
-                        cleaned_k = cleaned_k[0].lower() + cleaned_k[1:]
+                    cleaned_k = clean_fundamental_key(k)
                     for rec in v:
                         if rec.get("asOfDate") in data:
                             data[rec.get("asOfDate")].update({cleaned_k: rec.get('reportedValue', {}).get('raw')})
@@ -227,11 +423,23 @@ class YahooFinanceData(object):
                     data.update({k: v})
         return data
 
+    # Private method to get the FundamentalsMatrix of a timeseries response, parsed once per cached response
+    def _get_fundamentals_matrix(self, url, raw_data, fields):
+        raw_matrix = self._matrices.get(url)
+        if raw_matrix is None or raw_matrix[0] is not raw_data:
+            raw_matrix = (raw_data, FundamentalsMatrix.from_timeseries(raw_data, fields))
+            self._matrices[url] = raw_matrix
+        return raw_matrix[1]
+
     # Private method to _get_historical_data from yahoo finance
-    def _get_historical_data(self, url, config, tech_type, statement_type):
+    # fundamentals are returned as a FundamentalsMatrix of the given fields if fields is not None
+    def _get_historical_data(self, url, config, tech_type, statement_type, fields=None):
         data = self._request_handler(url, config.get("response_field"))
         if tech_type == '' and statement_type in ["income", "balance", "cash"]:
-            data = self._format_raw_fundamental_data(data)
+            if fields is not None:
+                data = self._get_fundamentals_matrix(url, data, fields)
+            else:
+                data = self._format_raw_fundamental_data(data)
         elif statement_type == 'analytic':
             data = data.get("result")
             if tech_type == "recommendations":
@@ -250,10 +458,9 @@ class YahooFinanceData(object):
             numerical_val = None
         return numerical_val
 
-    # Private method to format date serial string to readable format and vice versa
+    # Private method to format an epoch time as a utc date time string
     def _format_time(self, in_time):
-        form_date_time = datetime.datetime.fromtimestamp(int(in_time)).strftime('%Y-%m-%d %H:%M:%S')
-        return self._convert_to_utc(form_date_time)
+        return format_epoch_time(in_time)
 
     # Private method to return a sub dictionary entry for the earning report cleaning
     def _get_cleaned_sub_dict_ent(self, key, val_list):
@@ -302,28 +509,25 @@ class YahooFinanceData(object):
                     cleaned_data.update(dict_ent)
         return cleaned_data
 
+    # Private method to clean a single field of a summary or price report
+    def _clean_report_value(self, k, v):
+        if 'Time' in k:
+            return self._format_time(v)
+        elif 'Date' in k:
+            try:
+                return v['fmt']
+            except (KeyError, TypeError):
+                return '-'
+        elif v is None or isinstance(v, str) or isinstance(v, int) or isinstance(v, float):
+            return v
+        else:
+            return self._determine_numeric_value(v)
+
     # Private method to clean summary and price reports
     def _clean_reports(self, raw_data):
-        cleaned_dict = {}
         if raw_data is None:
             return None
-        for k, v in raw_data.items():
-            if 'Time' in k:
-                formatted_utc_time = self._format_time(v)
-                dict_ent = {k: formatted_utc_time}
-            elif 'Date' in k:
-                try:
-                    formatted_date = v['fmt']
-                except (KeyError, TypeError):
-                    formatted_date = '-'
-                dict_ent = {k: formatted_date}
-            elif v is None or isinstance(v, str) or isinstance(v, int) or isinstance(v, float):
-                dict_ent = {k: v}
-            else:
-                numerical_val = self._determine_numeric_value(v)
-                dict_ent = {k: numerical_val}
-            cleaned_dict.update(dict_ent)
-        return cleaned_dict
+        return {k: self._clean_report_value(k, v) for k, v in raw_data.items()}
 
     # Private Static Method to ensure ticker is URL encoded
     @staticmethod
@@ -331,8 +535,9 @@ class YahooFinanceData(object):
         encoded_ticker = ticker_str.replace('=', '%3D')
         return encoded_ticker
 
-    # Private Method to clean the dates of the newly returns historical stock data into readable format
-    def _clean_historical_data(self, hist_data, last_attempt=False):
+    # Private Class Method to clean the dates of the newly returns historical stock data into readable format
+    @classmethod
+    def _clean_historical_data(cls, hist_data, last_attempt=False):
         data = {}
         for k, v in hist_data.items():
             if k == 'eventsData':
@@ -341,29 +546,29 @@ class YahooFinanceData(object):
                     dict_ent = {k: event_obj}
                 else:
                     for type_key, type_obj in v.items():
-                        formatted_type_obj = {}
-                        for date_key, date_obj in type_obj.items():
-                            formatted_date_key = self.format_date(int(date_key))
-                            cleaned_date = self.format_date(int(date_obj['date']))
-                            date_obj.update({'formatted_date': cleaned_date})
-                            formatted_type_obj.update({formatted_date_key: date_obj})
+                        formatted_date_keys = format_epoch_dates([int(date_key) for date_key in type_obj])
+                        cleaned_dates = format_epoch_dates([int(date_obj['date']) for date_obj in type_obj.values()])
+                        # copies, the events belong to the cached response
+                        formatted_type_obj = {
+                            formatted_date_key: dict(date_obj, formatted_date=cleaned_date)
+                            for formatted_date_key, date_obj, cleaned_date
+                            in zip(formatted_date_keys, type_obj.values(), cleaned_dates)
+                        }
                         event_obj.update({type_key: formatted_type_obj})
                     dict_ent = {k: event_obj}
             elif 'date' in k.lower():
                 if v is not None:
-                    cleaned_date = self.format_date(v)
+                    cleaned_date = cls.format_date(v)
                     dict_ent = {k: {'formatted_date': cleaned_date, 'date': v}}
                 else:
                     if last_attempt is False:
                         return None
                     else:
                         dict_ent = {k: {'formatted_date': None, 'date': v}}
-            elif isinstance(v, list):
-                sub_dict_list = []
-                for sub_dict in v:
-                    sub_dict['formatted_date'] = self.format_date(sub_dict['date'])
-                    sub_dict_list.append(sub_dict)
-                dict_ent = {k: sub_dict_list}
+            elif isinstance(v, list) and not (v and isinstance(v[0], PriceBar)):
+                for sub_dict, formatted_date in zip(v, format_epoch_dates([sub_dict['date'] for sub_dict in v])):
+                    sub_dict['formatted_date'] = formatted_date
+                dict_ent = {k: v}
             else:
                 dict_ent = {k: v}
             data.update(dict_ent)
@@ -385,26 +590,34 @@ class YahooFinanceData(object):
         country_ent = COUNTRY_MAP.get(self.country.upper())
         meta_str = '&lang=' + country_ent.get("lang", "en-US") + '&region=' + country_ent.get("region", "US")
         api_url += '&events=' + event_str + meta_str
+        if 'div' in events and 'split' in events:
+            self._chart_ranges.setdefault(up_ticker, {})[api_url] = (hist_obj['start'], hist_obj['end'])
         return api_url
 
+    # Private Method to get the chart url of a historical price request, and the interval to resample it to or None
+    def _history_request(self, hist_obj, up_ticker):
+        if hist_obj.get('resample') and hist_obj['interval'] in RESAMPLE_INTERVALS:
+            # built from the daily bars, which share their cached response with daily requests
+            return self._build_api_url(dict(hist_obj, interval='1d'), up_ticker), hist_obj['interval']
+        return self._build_api_url(hist_obj, up_ticker), None
+
     # Private Method to get financial data via API Call
     def _get_api_data(self, url):
-        if self._cache.get(url):
-            return self._cache[url]
-        cur_url = url
-        if not "&crumb=" in cur_url:
-            cur_url += "&crumb=" + self.crumb
-        urlopener = UrlOpener(self.session, min_interval=self._MIN_INTERVAL)
-        urlopener.open(cur_url, proxy=self._get_proxy(), timeout=self.timeout)
-        if urlopener.status_code != 200:
+        try:
+            return self._fetch(url)
+        except DataNotFound:
+            raise
+        except ManagedException:
             # why is this not an exception???
             return None
-        self._cache[url] = loads(urlopener.text)
-        return self._cache[url]
 
     # Private Method to clean API data
-    def _clean_api_data(self, api_url):
-        raw_data = self._get_api_data(api_url)
+    def _clean_api_data(self, api_url, columnar=False, records=False, resample=None):
+        return self._clean_chart_data(self._get_api_data(api_url), columnar, records, resample)
+
+    # Private Static Method to clean a decoded chart response
+    @staticmethod
+    def _clean_chart_data(raw_data, columnar=False, records=False, resample=None):
         ret_obj = {}
         ret_obj.update({'eventsData': []})
         if raw_data is None:
@@ -413,6 +626,8 @@ class YahooFinanceData(object):
         if results is None:
             return ret_obj
         for result in results:
+            if resample is not None:
+                result = resample_chart_result(result, resample)
             tz_sub_dict = {}
             ret_obj.update({'eventsData': result.get('events', {})})
             ret_obj.update({'firstTradeDate': result['meta'].get('firstTradeDate', 'NA')})
@@ -420,35 +635,36 @@ class YahooFinanceData(object):
             ret_obj.update({'instrumentType': result['meta'].get('instrumentType', 'NA')})
             tz_sub_dict.update({'gmtOffset': result['meta']['gmtoffset']})
             ret_obj.update({'timeZone': tz_sub_dict})
-            timestamp_list = result['timestamp']
-            high_price_list = result['indicators']['quote'][0]['high']
-            low_price_list = result['indicators']['quote'][0]['low']
-            open_price_list = result['indicators']['quote'][0]['open']
-            close_price_list = result['indicators']['quote'][0]['close']
-            volume_list = result['indicators']['quote'][0]['volume']
-            adj_close_list = result['indicators']['adjclose'][0]['adjclose']
-            i = 0
-            prices_list = []
-            for timestamp in timestamp_list:
-                price_dict = {}
-                price_dict.update({'date': timestamp})
-                price_dict.update({'high': high_price_list[i]})
-                price_dict.update({'low': low_price_list[i]})
-                price_dict.update({'open': open_price_list[i]})
-                price_dict.update({'close': close_price_list[i]})
-                price_dict.update({'volume': volume_list[i]})
-                price_dict.update({'adjclose': adj_close_list[i]})
-                prices_list.append(price_dict)
-                i += 1
+            if columnar:
+                prices_list = PriceArrays.from_chart_result(result)
+            elif records:
+                prices_list = price_bars(result)
+            else:
+                quote = result['indicators']['quote'][0]
+                prices_list = [
+                    {'date': t, 'high': h, 'low': l, 'open': o, 'close': c, 'volume': v, 'adjclose': a}
+                    for t, h, l, o, c, v, a in zip(result['timestamp'], quote['high'], quote['low'], quote['open'],
+                                                   quote['close'], quote['volume'],
+                                                   result['indicators']['adjclose'][0]['adjclose'])
+                ]
             ret_obj.update({'prices': prices_list})
         return ret_obj
 
+    # Private Class Method to clean a decoded chart response into the history of a ticker, as hist_obj asks
+    @classmethod
+    def _clean_history(cls, raw_data, hist_obj, resample=None):
+        re_data = cls._clean_chart_data(raw_data, hist_obj.get('columnar', False), hist_obj.get('records', False),
+                                        resample)
+        cleaned_re_data = cls._clean_historical_data(re_data)
+        if cleaned_re_data and hist_obj.get('records', False):
+            cleaned_re_data['eventsData'] = event_records(cleaned_re_data['eventsData'])
+        return cleaned_re_data
+
     # Private Method to Handle Recursive API Request
     def _recursive_api_request(self, hist_obj, up_ticker, clean=True):
         if clean:
-            re_data = self._clean_api_data(self._build_api_url(hist_obj, up_ticker))
-            cleaned_re_data = self._clean_historical_data(re_data)
-            return cleaned_re_data
+            api_url, resample = self._history_request(hist_obj, up_ticker)
+            return self._clean_history(self._get_api_data(api_url), hist_obj, resample)
         else:
             re_data = self._get_api_data(self._build_api_url(hist_obj, up_ticker))
             return re_data
@@ -464,7 +680,7 @@ class YahooFinanceData(object):
         else:
             dict_ent = {}
             params = {}
-            r_map = get_request_config(tech_type, REQUEST_MAP)
+            r_map = get_request_config(tech_type, maps.REQUEST_MAP)
             r_cat = None
             if statement_type != 'analytic':
                 r_cat = get_request_category(tech_type, self.YAHOO_FINANCIAL_TYPES, statement_type)
@@ -476,15 +692,16 @@ class YahooFinanceData(object):
                 r_cat
             )
             if tech_type == '' and statement_type != 'history':
+                fields = fundamentals_fields(r_cat, hist_obj['interval']) if hist_obj.get('matrix') else None
                 try:
-                    re_data = self._get_historical_data(YAHOO_URL, REQUEST_MAP['fundamentals'], tech_type,
-                                                        statement_type)
+                    re_data = self._get_historical_data(YAHOO_URL, maps.REQUEST_MAP['fundamentals'], tech_type,
+                                                        statement_type, fields)
                     dict_ent = {up_ticker: re_data, 'dataType': report_name}
                 except KeyError:
                     re_data = None
                     dict_ent = {up_ticker: re_data, 'dataType': report_name}
             elif tech_type != '' and statement_type != 'history':
-                r_map = get_request_config(tech_type, REQUEST_MAP)
+                r_map = get_request_config(tech_type, maps.REQUEST_MAP)
                 try:
                     re_data = self._get_historical_data(YAHOO_URL, r_map, tech_type, statement_type)
                 except KeyError:
@@ -492,6 +709,13 @@ class YahooFinanceData(object):
                 dict_ent = {up_ticker: re_data}
             return dict_ent
 
+    # Private static method to build the data dictionary entry of a ticker without data
+    @staticmethod
+    def _empty_dict_ent(up_ticker, statement_type, tech_type, report_name):
+        if tech_type == '' and statement_type != 'history':
+            return {up_ticker: None, 'dataType': report_name}
+        return {up_ticker: None}
+
     # Private method to return the stmt_id for the reformat_process
     def _get_stmt_id(self, statement_type, raw_data):
         stmt_id = ''
@@ -548,14 +772,26 @@ class YahooFinanceData(object):
             tech_type = 'assetProfile'
             report_name = 'assetProfile'
         for tick in self.tickers:
-            try:
-                dict_ent = self._create_dict_ent(tick, statement_type, tech_type, report_name, hist_obj)
-                data.update(dict_ent)
-            except ManagedException:
-                logging.warning("yahoofinancials ticker: %s error getting %s - %s\n\tContinuing extraction...",
-                                str(tick), statement_type, str(ManagedException))
+            data.update(self._get_ticker_data(tick, statement_type, tech_type, report_name, hist_obj))
         return data
 
+    # Private Method to get the data dictionary entry of one ticker, used by get_stock_data()
+    def _get_ticker_data(self, tick, statement_type, tech_type, report_name, hist_obj):
+        if tick in self.bad_tickers:
+            return self._empty_dict_ent(tick, statement_type, tech_type, report_name)
+        try:
+            return self._create_dict_ent(tick, statement_type, tech_type, report_name, hist_obj)
+        except ManagedException as e:
+            self._ticker_error(tick, statement_type, e)
+            return self._empty_dict_ent(tick, statement_type, tech_type, report_name)
+
+    # Private Method to register and log the error of a ticker before continuing without its data
+    def _ticker_error(self, tick, statement_type, error):
+        if isinstance(error, TickerNotFound):
+            self.bad_tickers.add(tick, str(error))
+        logging.warning("yahoofinancials ticker: %s error getting %s - %s\n\tContinuing extraction...",
+                        str(tick), statement_type, str(error))
+
     # Public Method to get technical stock data
     def get_stock_tech_data(self, tech_type):
         if tech_type == 'defaultKeyStatistics':
@@ -588,6 +824,30 @@ class YahooFinanceData(object):
                 cleaned_data = None
         return cleaned_data
 
+    # Public method to get cleaned fields of a quoteSummary module, only the fields asked for are cleaned
+    def get_module_fields(self, module, fields):
+        data = {}
+        for tick in self.tickers:
+            data[tick] = None
+            if tick in self.bad_tickers:
+                continue
+            try:
+                raw_module = self._get_raw_module(tick, module)
+            except ManagedException as e:
+                if isinstance(e, TickerNotFound):
+                    self.bad_tickers.add(tick, str(e))
+                logging.warning("yahoofinancials ticker: %s error getting %s - %s\n\tContinuing extraction...",
+                                str(tick), module, str(e))
+                continue
+            if raw_module is None:
+                raw_module = {}
+            try:
+                data[tick] = {f: self._clean_report_value(f, raw_module[f]) if f in raw_module else None
+                              for f in fields}
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return data
+
     # Public method to get cleaned summary and price report data
     def get_clean_data(self, raw_report_data, report_type):
         cleaned_data_dict = {}
@@ -596,28 +856,79 @@ class YahooFinanceData(object):
             cleaned_data_dict.update({tick: cleaned_data})
         return cleaned_data_dict
 
-    # Private method to handle dividend data requests
+    # Private Method to get a cached chart url of a ticker whose range covers start to end, None if there is none
+    def _cached_chart_url(self, up_ticker, start, end):
+        ranges = self._chart_ranges.get(up_ticker, {})
+        for url, (chart_start, chart_end) in list(ranges.items()):
+            if url not in self._cache:
+                del ranges[url]
+                self._event_indexes.pop(url, None)
+            elif chart_start <= start and end <= chart_end:
+                return url
+        return None
+
+    # Private Method to get the EventIndex of a ticker's chart covering start to end, fetching one only when needed
+    def _get_event_index(self, up_ticker, start, end, interval):
+        url = self._cached_chart_url(up_ticker, start, end)
+        if url is None:
+            url = self._build_api_url({"start": start, "end": end, "interval": interval}, up_ticker)
+        raw_data = self._get_api_data(url)
+        if raw_data is None:
+            return None
+        raw_index = self._event_indexes.get(url)
+        if raw_index is None or raw_index[0] is not raw_data:
+            raw_index = (raw_data, EventIndex(raw_data['chart']['result'][0].get('events')))
+            self._event_indexes[url] = raw_index
+        return raw_index[1]
+
+    # Private Method to get the events of a type of a ticker from start to end as sorted dicts, None if there are none
+    def _handle_api_event_request(self, cur_ticker, start, end, interval, type_key):
+        event_index = self._get_event_index(cur_ticker, start, end, interval)
+        events = event_index.between(type_key, start, end) if event_index is not None else []
+        if not events:
+            return None
+        return [e.to_dict() for e in events]
+
+    # Private Method to get the dividends of a ticker from start to end
     def _handle_api_dividend_request(self, cur_ticker, start, end, interval):
-        re_dividends = []
-        hist_obj = {"start": start, "end": end, "interval": interval}
-        div_dict = self._recursive_api_request(hist_obj, cur_ticker, False)['chart']['result'][0]['events']['dividends']
-        for div_time_key, div_obj in div_dict.items():
-            dividend_obj = {
-                'date': div_obj['date'],
-                'formatted_date': self.format_date(int(div_obj['date'])),
-                'amount': div_obj.get('amount', None)
-            }
-            re_dividends.append(dividend_obj)
-        return sorted(re_dividends, key=lambda div: div['date'])
+        return self._handle_api_event_request(cur_ticker, start, end, interval, 'dividends')
 
-    # Public method to get daily dividend data
-    def get_stock_dividend_data(self, start, end, interval):
+    # Public method to get the dividends or splits of every ticker, from any cached chart covering the range
+    def get_stock_event_data(self, start, end, interval, type_key='dividends'):
         interval_code = self.get_time_code(interval)
         re_data = {}
         for tick in self.tickers:
+            if tick in self.bad_tickers:
+                re_data.update({tick: None})
+                continue
             try:
-                div_data = self._handle_api_dividend_request(tick, start, end, interval_code)
-                re_data.update({tick: div_data})
-            except:
+                re_data.update({tick: self._handle_api_event_request(tick, start, end, interval_code, type_key)})
+            except TickerNotFound as e:
+                self.bad_tickers.add(tick, str(e))
+                re_data.update({tick: None})
+            except (ManagedException, KeyError, IndexError, TypeError) as e:
+                logging.warning("yahoofinancials ticker: %s error getting %s - %s\n\tContinuing extraction...",
+                                str(tick), type_key, str(e))
                 re_data.update({tick: None})
         return re_data
+
+    # Public method to get daily dividend data
+    def get_stock_dividend_data(self, start, end, interval):
+        return self.get_stock_event_data(start, end, interval, 'dividends')
+
+
+# Global function run by the worker processes of process mode, decoding the raw content of a chart response and
+# cleaning it as get_historical_price_data does, so only the bytes and the cleaned history cross processes
+# content that is not json or holds a yahoo error raises the exception _fetch would for the same response of url
+def clean_chart_content(content, hist_obj, resample=None, json_loads=None, url=None):
+    try:
+        raw_data, decode_error = (json_loads or get_json_decoder())(content), None
+    except ValueError as e:  # bad json is a ValueError
+        raw_data, decode_error = None, e
+    error = response_exception(200, raw_data, url, decode_error)
+    if error is not None:
+        raise error
+    try:
+        return YahooFinanceData._clean_history(raw_data, hist_obj, resample)
+    except KeyError:
+        return None
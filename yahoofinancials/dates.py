@@ -0,0 +1,51 @@
+import datetime
+from functools import lru_cache
+
+SECONDS_PER_DAY = 24 * 60 * 60
+UTC_SUFFIX = ' UTC+0000'
+
+_EPOCH_DATE = datetime.date(1970, 1, 1)
+
+
+# memoized 'YYYY-MM-DD' string of a day number since the epoch
+@lru_cache(maxsize=1 << 16)
+def _format_day(days):
+    return str(_EPOCH_DATE + datetime.timedelta(days=days))
+
+
+# Global function to format an epoch timestamp (utc) as a 'YYYY-MM-DD' date string
+def format_epoch_date(timestamp):
+    return _format_day(int(timestamp // SECONDS_PER_DAY))
+
+
+# Global function to format a batch of epoch timestamps as 'YYYY-MM-DD' date strings
+# numpy arrays are converted with datetime64, returning an array of str, anything else through the day table
+def format_epoch_dates(timestamps):
+    if hasattr(timestamps, 'dtype'):
+        import numpy as np
+        days = (timestamps // SECONDS_PER_DAY).astype(np.int64).astype('datetime64[D]')
+        return np.datetime_as_string(days, unit='D')
+    return [_format_day(int(t // SECONDS_PER_DAY)) for t in timestamps]
+
+
+# Global function to format an epoch timestamp as a utc 'YYYY-MM-DD HH:MM:SS UTC+0000' date time string
+def format_epoch_time(timestamp):
+    days, seconds = divmod(int(timestamp), SECONDS_PER_DAY)
+    return f"{_format_day(days)} {seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}{UTC_SUFFIX}"
+
+
+# Global function to format a batch of epoch timestamps as utc date time strings
+# numpy arrays are converted with datetime64, returning an array of str
+def format_epoch_times(timestamps):
+    if hasattr(timestamps, 'dtype'):
+        import numpy as np
+        times = np.datetime_as_string(timestamps.astype(np.int64).astype('datetime64[s]'), unit='s')
+        return np.char.add(np.char.replace(times, 'T', ' '), UTC_SUFFIX)
+    return [format_epoch_time(t) for t in timestamps]
+
+
+# Global function to get a pytz timezone, looked up once per name
+@lru_cache(maxsize=None)
+def get_timezone(name):
+    import pytz
+    return pytz.timezone(name)
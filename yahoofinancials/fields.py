@@ -0,0 +1,59 @@
+from .maps import MODULES_MAP, QUOTE_FIELDS_MAP
+from .utils import import_optional
+
+
+# Global function to find the quoteSummary module of each field, as (module, field) pairs
+# fields can be 'module.field', otherwise the first module of QUOTE_FIELDS_MAP having the field is used
+def resolve_fields(fields):
+    resolved = []
+    for name in fields:
+        module, _, field = name.rpartition('.')
+        if not module:
+            module = next((m for m, m_fields in QUOTE_FIELDS_MAP.items() if field in m_fields), None)
+            if module is None:
+                raise ValueError("unknown field: " + str(name))
+        elif module not in MODULES_MAP:
+            raise ValueError("unknown module: " + str(module))
+        resolved.append((module, field))
+    return resolved
+
+
+# Class holding a ticker x field table of cleaned quoteSummary values
+class FieldTable:
+    """
+    tickers and fields index the rows and columns, rows holds one tuple of values per ticker,
+    None where yahoo has no value or the ticker has no data.
+    """
+
+    def __init__(self, tickers, fields, rows):
+        self.tickers = tickers
+        self.fields = fields
+        self.rows = rows
+        self._ticker_index = {t: i for i, t in enumerate(tickers)}
+        self._field_index = {f: i for i, f in enumerate(fields)}
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def __repr__(self):
+        return f"<FieldTable of {len(self.tickers)} tickers x {len(self.fields)} fields>"
+
+    def get(self, ticker, field, default=None):
+        value = self.rows[self._ticker_index[ticker]][self._field_index[field]]
+        return default if value is None else value
+
+    def row(self, ticker):
+        return dict(zip(self.fields, self.rows[self._ticker_index[ticker]]))
+
+    def column(self, field):
+        col = self._field_index[field]
+        return [row[col] for row in self.rows]
+
+    def to_dict(self):
+        return {tick: dict(zip(self.fields, row)) for tick, row in zip(self.tickers, self.rows)}
+
+    def to_frame(self):
+        pd = import_optional('pandas', 'pandas')
+        frame = pd.DataFrame.from_records(self.rows, columns=list(self.fields), index=list(self.tickers))
+        frame.index.name = 'ticker'
+        return frame
@@ -0,0 +1,48 @@
+from .utils import import_optional
+
+
+# Global function to build a frame of the columnar history of several tickers, indexed by (ticker, date)
+def history_frame(data):
+    pd = import_optional('pandas', 'pandas')
+    frames = {}
+    for tick, hist in data.items():
+        prices = hist.get('prices') if hist else None
+        if prices is None:
+            continue
+        columns = {c: prices[c] for c in ('open', 'high', 'low', 'close', 'volume', 'adjclose')}
+        index = pd.DatetimeIndex(prices.formatted_date.astype('datetime64[ns]'), name='date')
+        frames[tick] = pd.DataFrame(columns, index=index, copy=False)
+    if not frames:
+        return pd.DataFrame(columns=['open', 'high', 'low', 'close', 'volume', 'adjclose'],
+                            index=pd.MultiIndex.from_arrays([[], []], names=['ticker', 'date']))
+    return pd.concat(frames, names=['ticker', 'date'])
+
+
+# Global function to build a frame of the date x field statements of several tickers, indexed by (ticker, date)
+def statement_frame(data, tickers):
+    pd = import_optional('pandas', 'pandas')
+    frames = {}
+    for tick in tickers:
+        if data.get(tick):
+            frame = pd.DataFrame.from_dict(data[tick], orient='index')
+            frame.index = pd.DatetimeIndex(frame.index, name='date')
+            frames[tick] = frame.sort_index()
+    if not frames:
+        return pd.DataFrame(index=pd.MultiIndex.from_arrays([[], []], names=['ticker', 'date']))
+    return pd.concat(frames, names=['ticker', 'date'])
+
+
+# Global function to build a frame of the cleaned module data of several tickers, one row per ticker
+def module_frame(data, tickers):
+    pd = import_optional('pandas', 'pandas')
+    rows = {tick: data[tick] for tick in tickers if data.get(tick)}
+    frame = pd.DataFrame.from_dict(rows, orient='index')
+    frame = frame.reindex(list(tickers))
+    frame.index.name = 'ticker'
+    return frame
+
+
+# Global function to build a frame of {column: array} aligned by ticker, one row per ticker
+def columns_frame(columns, tickers):
+    pd = import_optional('pandas', 'pandas')
+    return pd.DataFrame(columns, index=pd.Index(list(tickers), name='ticker'))
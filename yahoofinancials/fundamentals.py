@@ -0,0 +1,155 @@
+from array import array
+from bisect import bisect_right
+
+from . import maps
+from .utils import clean_fundamental_key, import_optional
+
+NAN = float('nan')
+
+
+# Global function to get the fields of a statement, i.e. the cleaned FUNDAMENTALS_MAP types, in a stable order
+def fundamentals_fields(report_type, frequency):
+    fields = []
+    for type_name in maps.FUNDAMENTALS_MAP[report_type][frequency]:
+        field = clean_fundamental_key(type_name)
+        if field not in fields:
+            fields.append(field)
+    return sorted(fields)
+
+
+# Class holding the statement of a ticker as a dense date x field matrix of floats
+class FundamentalsMatrix:
+    """
+    dates is the sorted list of 'YYYY-MM-DD' asOfDates, fields the list of statement fields and
+    values a flat, row major, array of float64 with NaN where yahoo has no value, so that
+    values[row * len(fields) + col] is the value of fields[col] at dates[row]. reported is a bytearray
+    of the same layout, 1 where the response has a record, so fields yahoo reports without a value
+    are kept as None by to_dict(), as get_financial_stmts always did.
+    to_numpy() gives a dates x fields numpy view of values, to_dict() and to_list() the flat and
+    default formats of get_financial_stmts.
+    latest(), as_of(date) and last(n, date) find periods by bisecting the sorted dates.
+    The trailing twelve months series yahoo sends along with the statements are dated at the latest
+    quarter end, they are kept out of the periods in trailing, a FundamentalsMatrix of their own, or
+    None without any, and to_dict() adds them back where a period does not report the field.
+    """
+
+    def __init__(self, dates, fields, values, reported=None):
+        self.dates = dates
+        self.fields = fields
+        self.values = values
+        self.reported = bytearray(v == v for v in values) if reported is None else reported
+        self.trailing = None
+        self._date_index = {d: i for i, d in enumerate(dates)}
+        self._field_index = {f: i for i, f in enumerate(fields)}
+
+    @classmethod
+    def from_timeseries(cls, raw_data, fields=()):
+        periods, trailing = [], []
+        for i in raw_data.get("result") or []:
+            for k, v in i.items():
+                if k not in ('meta', 'timestamp'):
+                    (trailing if k.startswith('trailing') else periods).append((k, v))
+        matrix = cls._from_series(periods, fields)
+        if trailing:
+            matrix.trailing = cls._from_series(trailing, fields)
+        return matrix
+
+    @classmethod
+    def _from_series(cls, type_series, fields):
+        fields = list(fields)
+        field_index = {f: i for i, f in enumerate(fields)}
+        series, dates = [], set()
+        for k, v in type_series:
+            field = clean_fundamental_key(k)
+            if field not in field_index:
+                field_index[field] = len(fields)
+                fields.append(field)
+            records = [rec for rec in v if rec and rec.get("asOfDate")]
+            series.append((field_index[field], records))
+            dates.update(rec["asOfDate"] for rec in records)
+        dates = sorted(dates)
+        date_index = {d: i for i, d in enumerate(dates)}
+        width = len(fields)
+        values = array('d', [NAN]) * (len(dates) * width)
+        reported = bytearray(len(values))
+        for col, records in series:
+            for rec in records:
+                cell = date_index[rec["asOfDate"]] * width + col
+                reported[cell] = 1
+                value = (rec.get('reportedValue') or {}).get('raw')
+                if value is not None:
+                    values[cell] = value
+        return cls(dates, fields, values, reported)
+
+    def __len__(self):
+        return len(self.dates)
+
+    def __repr__(self):
+        return f"<FundamentalsMatrix of {len(self.dates)} dates x {len(self.fields)} fields>"
+
+    @property
+    def shape(self):
+        return len(self.dates), len(self.fields)
+
+    def get(self, date, field, default=None):
+        row, col = self._date_index.get(date), self._field_index.get(field)
+        if row is None or col is None:
+            return default
+        value = self.values[row * len(self.fields) + col]
+        return default if value != value else value
+
+    def column(self, field):
+        return self.values[self._field_index[field]::len(self.fields)]
+
+    def row(self, date):
+        start = self._date_index[date] * len(self.fields)
+        return self.values[start:start + len(self.fields)]
+
+    # date of the newest period, None without periods
+    def latest(self):
+        return self.dates[-1] if self.dates else None
+
+    # date of the newest period on or before date, a 'YYYY-MM-DD' string or a datetime.date, None if there is none
+    def as_of(self, date):
+        end = bisect_right(self.dates, str(date))
+        return self.dates[end - 1] if end else None
+
+    # dates of the n newest periods, on or before date if given, oldest first, all of them if n is None
+    def last(self, n, date=None):
+        end = len(self.dates) if date is None else bisect_right(self.dates, str(date))
+        return self.dates[0 if n is None else max(end - n, 0):end]
+
+    # {date: {field: value}} of the given fields at the given dates, all dates if None, with None for NaN
+    def select(self, fields, dates=None):
+        width = len(self.fields)
+        cols = [self._field_index.get(f) for f in fields]
+        data = {}
+        for date in self.dates if dates is None else dates:
+            start = self._date_index[date] * width
+            values = [None if c is None else self.values[start + c] for c in cols]
+            data[date] = {f: None if v is None or v != v else v for f, v in zip(fields, values)}
+        return data
+
+    def to_numpy(self):
+        np = import_optional('numpy', 'numpy')
+        return np.frombuffer(self.values, dtype=np.float64).reshape(self.shape)
+
+    # {date: {field: value}} of the fields in the response at each date, None where they have no value,
+    # trailing values included at their date unless a period reports the same field
+    def to_dict(self):
+        width = len(self.fields)
+        data = {}
+        for row, date in enumerate(self.dates):
+            start = row * width
+            data[date] = {f: v if v == v else None for f, v, r in
+                          zip(self.fields, self.values[start:start + width], self.reported[start:start + width]) if r}
+        if self.trailing is not None:
+            for date, item in self.trailing.to_dict().items():
+                row = data.setdefault(date, {})
+                for f, v in item.items():
+                    row.setdefault(f, v)
+            data = dict(sorted(data.items()))
+        return data
+
+    def to_list(self):
+        return [{date: item} for date, item in self.to_dict().items()]
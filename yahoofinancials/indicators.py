@@ -0,0 +1,227 @@
+import math
+from collections import deque
+
+from .utils import import_optional
+
+NAN = float('nan')
+
+
+# Base class of the indicators, fed one bar at a time with update() or a whole history at once with run()
+class Indicator:
+    """
+    update(high, low, close) adds a bar in O(1) and returns the indicator value, NaN while warming up.
+    run(high, low, close) adds the bars of numpy arrays and returns the array of the values at each bar.
+    Bars with a missing (NaN) input are skipped, their value is NaN and the state is left as it was.
+    """
+
+    def __init__(self):
+        self.value = NAN
+
+    def update(self, high, low, close):
+        if high != high or low != low or close != close:
+            return NAN
+        self.value = self._update(high, low, close)
+        return self.value
+
+    def run(self, high, low, close):
+        np = import_optional('numpy', 'numpy')
+        return np.array([self.update(h, l, c) for h, l, c in zip(high.tolist(), low.tolist(), close.tolist())],
+                        dtype=np.float64)
+
+
+# Simple moving average of the close over window bars
+class SMA(Indicator):
+
+    def __init__(self, window):
+        super().__init__()
+        self.window = window
+        self._closes = deque(maxlen=window)
+        self._sum = 0.0
+
+    def _update(self, high, low, close):
+        if len(self._closes) == self.window:
+            self._sum -= self._closes[0]
+        self._closes.append(close)
+        self._sum += close
+        return self._sum / self.window if len(self._closes) == self.window else NAN
+
+    # vectorized with a cumulative sum, the state is then set from the last window bars
+    def run(self, high, low, close):
+        np = import_optional('numpy', 'numpy')
+        valid = ~(np.isnan(high) | np.isnan(low) | np.isnan(close))
+        prior = len(self._closes)
+        closes = np.concatenate([np.array(self._closes, dtype=np.float64), close[valid]])
+        sums = np.cumsum(np.concatenate([[0.0], closes]))
+        values = np.full(len(closes), np.nan)
+        values[self.window - 1:] = (sums[self.window:] - sums[:-self.window]) / self.window
+        self._closes.clear()
+        self._closes.extend(closes[-self.window:].tolist())
+        self._sum = math.fsum(self._closes)
+        if len(closes) > prior:
+            self.value = float(values[-1])
+        out = np.full(len(close), np.nan)
+        out[valid] = values[prior:]
+        return out
+
+
+# Exponential moving average of the close, with alpha 2 / (span + 1) and seeded with the first close
+class EMA(Indicator):
+
+    def __init__(self, span):
+        super().__init__()
+        self.span = span
+        self.alpha = 2.0 / (span + 1)
+
+    def _update(self, high, low, close):
+        if self.value != self.value:
+            return close
+        return self.value + self.alpha * (close - self.value)
+
+
+# Relative strength index of the close, with Wilder's smoothing over period bars
+class RSI(Indicator):
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.period = period
+        self._prev_close = None
+        self._count = 0
+        self._avg_gain = self._avg_loss = 0.0
+
+    def _update(self, high, low, close):
+        prev_close, self._prev_close = self._prev_close, close
+        if prev_close is None:
+            return NAN
+        change = close - prev_close
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        self._count += 1
+        if self._count <= self.period:
+            self._avg_gain += gain / self.period
+            self._avg_loss += loss / self.period
+            if self._count < self.period:
+                return NAN
+        else:
+            self._avg_gain = (self._avg_gain * (self.period - 1) + gain) / self.period
+            self._avg_loss = (self._avg_loss * (self.period - 1) + loss) / self.period
+        if self._avg_loss == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + self._avg_gain / self._avg_loss)
+
+
+# Average true range, with Wilder's smoothing over period bars
+class ATR(Indicator):
+
+    def __init__(self, period=14):
+        super().__init__()
+        self.period = period
+        self._prev_close = None
+        self._count = 0
+        self._atr = 0.0
+
+    def _update(self, high, low, close):
+        prev_close, self._prev_close = self._prev_close, close
+        if prev_close is None:
+            true_range = high - low
+        else:
+            true_range = max(high, prev_close) - min(low, prev_close)
+        self._count += 1
+        if self._count <= self.period:
+            self._atr += true_range / self.period
+            return self._atr if self._count == self.period else NAN
+        self._atr = (self._atr * (self.period - 1) + true_range) / self.period
+        return self._atr
+
+
+# Rolling volatility, the sample standard deviation of the log returns of the close over window returns,
+# annualized by the square root of periods_per_year unless it is None
+class RollingVolatility(Indicator):
+
+    def __init__(self, window=20, periods_per_year=252):
+        super().__init__()
+        self.window = window
+        self.scale = 1.0 if periods_per_year is None else math.sqrt(periods_per_year)
+        self._prev_close = None
+        self._returns = deque(maxlen=window)
+        self._sum = self._sum_sq = 0.0
+
+    def _update(self, high, low, close):
+        prev_close, self._prev_close = self._prev_close, close
+        if prev_close is None:
+            return NAN
+        if len(self._returns) == self.window:
+            old = self._returns[0]
+            self._sum -= old
+            self._sum_sq -= old * old
+        ret = math.log(close / prev_close)
+        self._returns.append(ret)
+        self._sum += ret
+        self._sum_sq += ret * ret
+        if len(self._returns) < self.window:
+            return NAN
+        variance = (self._sum_sq - self._sum * self._sum / self.window) / (self.window - 1)
+        return math.sqrt(max(variance, 0.0)) * self.scale
+
+    # vectorized over sliding windows, the state is then set from the last window returns
+    def run(self, high, low, close):
+        np = import_optional('numpy', 'numpy')
+        valid = ~(np.isnan(high) | np.isnan(low) | np.isnan(close))
+        closes = close[valid]
+        if self._prev_close is not None:
+            closes = np.concatenate([[self._prev_close], closes])
+        prior = len(self._returns)
+        returns = np.concatenate([np.array(self._returns, dtype=np.float64), np.diff(np.log(closes))])
+        values = np.full(len(returns), np.nan)
+        if len(returns) >= self.window:
+            windows = np.lib.stride_tricks.sliding_window_view(returns, self.window)
+            values[self.window - 1:] = windows.std(axis=1, ddof=1) * self.scale
+        if len(closes):
+            self._prev_close = float(closes[-1])
+        self._returns.clear()
+        self._returns.extend(returns[-self.window:].tolist())
+        self._sum = math.fsum(self._returns)
+        self._sum_sq = math.fsum(r * r for r in self._returns)
+        new_values = values[prior:]
+        if len(new_values):
+            self.value = float(new_values[-1])
+        # without a previous close the first bar has no return
+        out = np.full(len(close), np.nan)
+        out[valid] = np.concatenate([np.full(int(valid.sum()) - len(new_values), np.nan), new_values])
+        return out
+
+
+# Class running a set of indicators over the price history of a ticker and updating them with new bars
+class IndicatorSet:
+    """
+    sma and ema are tuples of windows and spans, rsi, atr and volatility the period or window of each,
+    None or () leaves an indicator out. Indicators are named like 'sma50', 'ema12', 'rsi14', 'atr14'
+    and 'volatility20'.
+    run(prices) computes them over a PriceArrays, values then holds the numpy array of each at each bar.
+    update(high, low, close) adds a bar to all of them in O(1) and returns {name: value}, as does latest().
+    """
+
+    def __init__(self, sma=(50, 200), ema=(12, 26), rsi=14, atr=14, volatility=20, periods_per_year=252):
+        self.indicators = {}
+        for window in sma or ():
+            self.indicators['sma%d' % window] = SMA(window)
+        for span in ema or ():
+            self.indicators['ema%d' % span] = EMA(span)
+        if rsi:
+            self.indicators['rsi%d' % rsi] = RSI(rsi)
+        if atr:
+            self.indicators['atr%d' % atr] = ATR(atr)
+        if volatility:
+            self.indicators['volatility%d' % volatility] = RollingVolatility(volatility, periods_per_year)
+        self.values = {}
+
+    def __repr__(self):
+        return f"<IndicatorSet of {', '.join(self.indicators)}>"
+
+    def run(self, prices):
+        self.values = {name: ind.run(prices.high, prices.low, prices.close) for name, ind in self.indicators.items()}
+        return self
+
+    def update(self, high, low, close):
+        return {name: ind.update(high, low, close) for name, ind in self.indicators.items()}
+
+    def latest(self):
+        return {name: ind.value for name, ind in self.indicators.items()}
@@ -0,0 +1,111 @@
+from bisect import bisect_left, bisect_right
+
+from .dates import format_epoch_date
+
+
+# Base class of the compact record types, attribute access only and formatted_date computed on use
+class _Record:
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_tuple() == other.to_tuple()
+
+    def __repr__(self):
+        return f"{type(self).__name__}({', '.join(f'{n}={getattr(self, n)!r}' for n in self.__slots__)})"
+
+    @property
+    def formatted_date(self):
+        return format_epoch_date(self.date)
+
+    def to_tuple(self):
+        return tuple(getattr(self, n) for n in self.__slots__)
+
+    def to_dict(self):
+        return dict(zip(self.__slots__ + ('formatted_date',), self.to_tuple() + (self.formatted_date,)))
+
+
+class PriceBar(_Record):
+    __slots__ = ('date', 'high', 'low', 'open', 'close', 'volume', 'adjclose')
+
+
+class DividendEvent(_Record):
+    __slots__ = ('date', 'amount')
+
+
+class SplitEvent(_Record):
+    __slots__ = ('date', 'numerator', 'denominator', 'splitRatio')
+
+
+# Class used as a PriceBar over a row of a PriceArrays, without copying the row
+class PriceBarView:
+    __slots__ = ('_prices', '_index')
+
+    def __init__(self, prices, index):
+        self._prices = prices
+        self._index = index
+
+    def __getattr__(self, column):
+        if column == 'formatted_date':
+            return format_epoch_date(int(self._prices.date[self._index]))
+        try:
+            value = self._prices[column][self._index]
+        except KeyError:
+            raise AttributeError(column) from None
+        if value != value:
+            return None
+        return int(value) if column == 'volume' else value.item()
+
+    def __repr__(self):
+        return f"PriceBarView({self._index})"
+
+    def to_dict(self):
+        return {c: getattr(self, c) for c in PriceBar.__slots__ + ('formatted_date',)}
+
+
+# Global function to build the PriceBars of the zipped columns of a chart response
+def price_bars(result):
+    quote = result['indicators']['quote'][0]
+    return [
+        PriceBar(*bar) for bar in zip(result['timestamp'], quote['high'], quote['low'], quote['open'], quote['close'],
+                                      quote['volume'], result['indicators']['adjclose'][0]['adjclose'])
+    ]
+
+
+# Global function to convert cleaned eventsData into lists of DividendEvent and SplitEvent sorted by date
+# other event types, such as earnings, have no record class and are passed through as they are
+def event_records(events_data):
+    events = {}
+    for type_key, type_obj in (events_data or {}).items():
+        if type_key == 'dividends':
+            records = [DividendEvent(e['date'], e.get('amount')) for e in type_obj.values()]
+        elif type_key == 'splits':
+            records = [SplitEvent(e['date'], e.get('numerator'), e.get('denominator'), e.get('splitRatio'))
+                       for e in type_obj.values()]
+        else:
+            events[type_key] = type_obj
+            continue
+        events[type_key] = sorted(records, key=lambda r: r.date)
+    return events
+
+
+# Class indexing the dividends and splits of a chart response by date, to get those of any range by bisection
+class EventIndex:
+    """
+    events holds the DividendEvent and SplitEvent lists of event_records(), sorted by date, and
+    between(type_key, start, end) the events of a type dated from start to end, epoch seconds included.
+    """
+
+    def __init__(self, events_data):
+        self.events = {k: v for k, v in event_records(events_data).items() if k in ('dividends', 'splits')}
+        self._dates = {type_key: [e.date for e in records] for type_key, records in self.events.items()}
+
+    def __repr__(self):
+        return f"<EventIndex of {', '.join(f'{len(v)} {k}' for k, v in self.events.items())}>"
+
+    def between(self, type_key, start, end):
+        dates = self._dates.get(type_key, [])
+        return self.events.get(type_key, [])[bisect_left(dates, start):bisect_right(dates, end)]
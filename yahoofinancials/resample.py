@@ -0,0 +1,111 @@
+import datetime
+from functools import lru_cache
+
+from .dates import SECONDS_PER_DAY, get_timezone
+
+_EPOCH_DATE = datetime.date(1970, 1, 1)
+
+# chart intervals that can be built from daily bars
+RESAMPLE_INTERVALS = ('1wk', '1mo')
+
+
+# memoized day number since the epoch of the first day of the month of a day number
+@lru_cache(maxsize=1 << 12)
+def _month_start(days):
+    date = _EPOCH_DATE + datetime.timedelta(days=days)
+    return days - date.day + 1
+
+
+# Global function to get the first day, as a day number since the epoch, of the bucket of a local day number
+# weeks start on monday, as yahoo's 1wk bars do, and months on their first day
+def bucket_start(days, interval):
+    if interval == '1wk':
+        # the epoch was a thursday
+        return days - (days + 3) % 7
+    if interval == '1mo':
+        return _month_start(days)
+    raise ValueError("cannot resample to interval: " + str(interval))
+
+
+# Private function to get the first, last, max or min of the non null values of a bucket
+def _first(values):
+    return next((v for v in values if v is not None), None)
+
+
+def _last(values):
+    return next((v for v in reversed(values) if v is not None), None)
+
+
+def _max(values):
+    return max((v for v in values if v is not None), default=None)
+
+
+def _min(values):
+    return min((v for v in values if v is not None), default=None)
+
+
+def _sum(values):
+    values = [v for v in values if v is not None]
+    return sum(values) if values else None
+
+
+# Private function to get the pytz timezone of the exchange of a chart result, None if it has no known one
+def _exchange_timezone(meta):
+    name = meta.get('exchangeTimezoneName')
+    if not name:
+        return None
+    try:
+        return get_timezone(name)
+    except KeyError:
+        return None
+
+
+# Private function to get the utc offset in seconds of a timezone at a timestamp
+def _utc_offset(tz, timestamp):
+    return int(datetime.datetime.fromtimestamp(timestamp, tz).utcoffset().total_seconds())
+
+
+# Private function to get the timestamp of local midnight of a day number in a timezone
+def _local_midnight(tz, days):
+    midnight = datetime.datetime.combine(_EPOCH_DATE + datetime.timedelta(days=days), datetime.time())
+    return days * SECONDS_PER_DAY - int(tz.localize(midnight).utcoffset().total_seconds())
+
+
+# Global function to resample the daily bars of a chart result into weekly or monthly bars
+# buckets are found in the exchange time of the result, with the utc offset of its exchangeTimezoneName at each bar
+# so they follow daylight saving time (the current gmtoffset of the meta without it), and each bar is dated at local
+# midnight of the first day of its bucket, like the bars yahoo returns for these intervals. Nulls are skipped: the
+# open is the first open, the close and adjclose the last ones, the high and low the max and min and the volume
+# their sum. The result is a chart result, with the meta and events of the daily one, so it is cleaned as a
+# response would be.
+def resample_chart_result(result, interval):
+    tz = _exchange_timezone(result['meta'])
+    gmtoffset = result['meta'].get('gmtoffset') or 0
+    timestamps = result.get('timestamp') or []
+    quote = result['indicators']['quote'][0]
+    columns = (quote['open'], quote['high'], quote['low'], quote['close'], quote['volume'],
+               result['indicators']['adjclose'][0]['adjclose'])
+    bounds, starts = [], []
+    for i, timestamp in enumerate(timestamps):
+        offset = gmtoffset if tz is None else _utc_offset(tz, timestamp)
+        start = bucket_start((timestamp + offset) // SECONDS_PER_DAY, interval)
+        if not starts or start != starts[-1]:
+            starts.append(start)
+            bounds.append(i)
+    bounds.append(len(timestamps))
+    aggregated = [[], [], [], [], [], []]
+    for begin, end in zip(bounds, bounds[1:]):
+        for out, column, func in zip(aggregated, columns, (_first, _max, _min, _last, _sum, _last)):
+            out.append(func(column[begin:end]))
+    opens, highs, lows, closes, volumes, adjcloses = aggregated
+    resampled = dict(result)
+    if tz is None:
+        resampled['timestamp'] = [start * SECONDS_PER_DAY - gmtoffset for start in starts]
+    else:
+        resampled['timestamp'] = [_local_midnight(tz, start) for start in starts]
+    resampled['indicators'] = {
+        'quote': [{'open': opens, 'high': highs, 'low': lows, 'close': closes, 'volume': volumes}],
+        'adjclose': [{'adjclose': adjcloses}],
+    }
+    resampled['meta'] = dict(result['meta'], dataGranularity=interval)
+    return resampled
@@ -0,0 +1,90 @@
+import operator
+import re
+import time
+
+from .utils import import_optional
+
+# comparison operators of the screen conditions
+OPERATORS = {'>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le, '==': operator.eq,
+             '!=': operator.ne}
+
+_CONDITION = re.compile(r'^\s*([\w.]+)\s*(>=|<=|==|!=|>|<)\s*(\S+)\s*$')
+_SUFFIXES = {'k': 1e3, 'm': 1e6, 'b': 1e9, 't': 1e12}
+
+
+# Private function to read the number of a condition, with an optional k, m, b or t suffix, e.g. '2B'
+def _number(text):
+    multiplier = _SUFFIXES.get(text[-1].lower())
+    if multiplier is not None:
+        return float(text[:-1]) * multiplier
+    return float(text)
+
+
+# Global function to get the (field, operator, value) conditions of a screen
+# conditions are either a string of conditions joined by 'and', e.g. 'marketCap > 2B and trailingPE < 15',
+# or a list of (field, operator, value) tuples
+def parse_conditions(conditions):
+    if isinstance(conditions, str):
+        parsed = []
+        for text in re.split(r'\s+and\s+', conditions.strip(), flags=re.IGNORECASE):
+            match = _CONDITION.match(text)
+            if match is None:
+                raise ValueError("invalid screen condition: " + str(text))
+            try:
+                parsed.append((match.group(1), match.group(2), _number(match.group(3))))
+            except ValueError:
+                raise ValueError("invalid screen condition: " + str(text)) from None
+        return parsed
+    parsed = [tuple(c) for c in conditions]
+    for field, op, _ in parsed:
+        if op not in OPERATORS:
+            raise ValueError("unknown screen operator: " + str(op) + " for field: " + str(field))
+    return parsed
+
+
+# Class holding a ticker x field snapshot of quoteSummary values as numpy columns, to screen a universe at once
+class Snapshot:
+    """
+    columns maps each loaded field to a float64 array aligned with tickers, NaN where the value is missing
+    or not a number, and loaded to the time.time() it was loaded at.
+    stale(fields, max_age) tells which fields are to be loaded, update(table) loads the columns of a FieldTable
+    and select(conditions) returns the tickers meeting all the conditions, missing values meeting none.
+    """
+
+    def __init__(self, tickers):
+        self.tickers = list(tickers)
+        self.columns = {}
+        self.loaded = {}
+
+    def __len__(self):
+        return len(self.tickers)
+
+    def __repr__(self):
+        return f"<Snapshot of {len(self.tickers)} tickers x {len(self.columns)} fields>"
+
+    # fields missing from the snapshot or loaded more than max_age seconds ago
+    def stale(self, fields, max_age=None):
+        now = time.time()
+        return [f for f in fields if f not in self.columns or (max_age is not None and now - self.loaded[f] > max_age)]
+
+    def update(self, table):
+        np = import_optional('numpy', 'numpy')
+        now = time.time()
+        for field in table.fields:
+            values = [v if isinstance(v, (int, float)) and not isinstance(v, bool) else None
+                      for v in table.column(field)]
+            self.columns[field] = np.array(values, dtype=np.float64)
+            self.loaded[field] = now
+
+    # boolean array of the tickers meeting all the conditions
+    def mask(self, conditions):
+        np = import_optional('numpy', 'numpy')
+        mask = np.ones(len(self.tickers), dtype=bool)
+        for field, op, value in parse_conditions(conditions):
+            column = self.columns[field]
+            mask &= ~np.isnan(column) & OPERATORS[op](column, value)
+        return mask
+
+    def select(self, conditions):
+        np = import_optional('numpy', 'numpy')
+        return [self.tickers[i] for i in np.flatnonzero(self.mask(conditions))]
@@ -1,7 +1,5 @@
 #!/usr/bin/env python3
 import random
-from requests import Session
-from requests.exceptions import ConnectionError, RetryError
 
 
 DEFAULT_TIMEOUT = 5
@@ -122,12 +120,11 @@ HEADERS = [
 ]
 
 
-random.seed()
-
 # remember LastSession (has cookies), associated Crumb, and which QueryServer
 LastSession = Crumb = QueryServer = None
 
-def _setup_session_with_cookies_and_crumb(session: Session):
+def _setup_session_with_cookies_and_crumb(session):
+    from requests.exceptions import ConnectionError
     global LastSession, Crumb
     # use cached value
     if LastSession and Crumb:
@@ -157,6 +154,7 @@ def _setup_session_with_cookies_and_crumb(session: Session):
 
 
 def _get_crumb(session):
+    from requests.exceptions import ConnectionError, RetryError
     global QueryServer, Crumb
     try:
         # does yahoo tell me which queryserver I should use???
@@ -182,7 +180,11 @@ def _get_crumb(session):
 
 
 def init_session(session=None, **kwargs):
+    # requests is imported on first use, and not at all while a session is cached
+    if not session and LastSession and Crumb:
+        return LastSession, Crumb, QueryServer
     if not session:
+        from requests import Session
         session = Session()
         if kwargs.get("proxies"):
             session.proxies = kwargs.get("proxies")
@@ -1,7 +1,19 @@
+import importlib
+import json
+
+
 def remove_prefix(s, prefix):
     return s[len(prefix):] if s.startswith(prefix) else s
 
 
+def clean_fundamental_key(k):
+    # annualNetIncome, quarterlyNetIncome and trailingNetIncome are all netIncome
+    cleaned_k = remove_prefix(remove_prefix(remove_prefix(k, "quarterly"), "annual"), "trailing")
+    if cleaned_k in ['EBIT']:
+        return cleaned_k.lower()
+    return cleaned_k[0].lower() + cleaned_k[1:]
+
+
 def get_request_config(tech_type, req_map):
     if tech_type == '':
         r_map = req_map['fundamentals']
@@ -20,3 +32,29 @@ def get_request_category(tech_type, fin_types, statement_type):
     else:
         r_cat = tech_type
     return r_cat
+
+
+def get_json_decoder(decoder=None):
+    # decoder can be a callable, 'json', 'orjson' or None for the fastest one installed
+    # decoders are handed the raw response bytes
+    if callable(decoder):
+        return decoder
+    if decoder in (None, 'orjson'):
+        try:
+            import orjson
+            return orjson.loads
+        except ImportError:
+            if decoder == 'orjson':
+                raise
+    elif decoder != 'json':
+        raise ValueError("invalid json decoder: " + str(decoder))
+    return json.loads
+
+
+def import_optional(module, extra):
+    # import an optional dependency, explaining how to install it when missing
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            f"{module} is required for this feature, install it with: pip install yahoofinancials[{extra}]") from None
@@ -14,21 +14,61 @@ MIT License
 
 List of Included Functions:
 
-1) get_financial_stmts(frequency, statement_type, reformat=True)
+1) get_financial_stmts(frequency, statement_type, reformat=True, as_frame=False, as_matrix=False)
    - frequency can be either 'annual' or 'quarterly'.
    - statement_type can be 'income', 'balance', 'cash'.
    - reformat optional value defaulted to true. Enter False for unprocessed raw data from Yahoo Finance.
-2) get_stock_price_data(reformat=True)
+   - as_frame optional value defaulted to False. Enter True for a pandas DataFrame indexed by (ticker, date).
+   - as_matrix optional value defaulted to False. Enter True for a FundamentalsMatrix of dates x fields per ticker.
+2) get_stock_price_data(reformat=True, as_frame=False)
 3) get_stock_earnings_data()
    - reformat optional value defaulted to true. Enter False for unprocessed raw data from Yahoo Finance.
-4) get_summary_data(reformat=True)
+4) get_summary_data(reformat=True, as_frame=False)
    - reformat optional value defaulted to true. Enter False for unprocessed raw data from Yahoo Finance.
+   - as_frame optional value defaulted to False. Enter True for a pandas DataFrame with one row per ticker.
 5) get_stock_quote_type_data()
-6) get_historical_price_data(start_date, end_date, time_interval)
+6) get_historical_price_data(start_date, end_date, time_interval, columnar=False, as_frame=False, as_records=False,
+                              resample=False)
    - Gets historical price data for currencies, stocks, indexes, cryptocurrencies, and commodity futures.
    - start_date should be entered in the 'YYYY-MM-DD' format. First day that financial data will be pulled.
    - end_date should be entered in the 'YYYY-MM-DD' format. Last day that financial data will be pulled.
    - time_interval can be either 'daily', 'weekly', or 'monthly'. Parameter determines the time period interval.
+   - columnar optional value defaulted to False. Enter True for prices as a PriceArrays of numpy columns.
+   - as_frame optional value defaulted to False. Enter True for prices as a pandas DataFrame indexed by (ticker, date).
+   - as_records optional value defaulted to False. Enter True for prices as PriceBar, and events as DividendEvent
+     and SplitEvent, records with __slots__.
+   - resample optional value defaulted to False. Enter True to build weekly and monthly bars from the daily bars.
+7) iter_historical_price_data(start_date, end_date, time_interval, columnar=False, as_records=False,
+                               completion_order=False, resample=False)
+   - Yields (ticker, data) pairs one ticker at a time, as get_historical_price_data would return for each ticker.
+   - completion_order optional value defaulted to False. Enter True to yield tickers as their requests complete.
+   - With processes=N, responses are decoded and cleaned by N worker processes instead of the request threads.
+   - close(), or a with block, shuts the worker processes down.
+8) export_historical_price_data(path, start_date, end_date, time_interval, file_format='parquet')
+   - Writes historical price data to a parquet, or arrow ipc, file one ticker at a time.
+9) export_financial_stmts(path, frequency, statement_type, file_format='parquet')
+   - Writes a financial statement to a parquet, or arrow ipc, file one ticker at a time.
+10) prefetch(tickers=None, modules=PREFETCH_MODULES, history=None, fundamentals=None, progress=None)
+   - Loads modules, history and fundamentals for many tickers into the cache using concurrent requests.
+11) get_statement_metrics(frequency, statement_type, metrics, periods=1, as_of=None)
+   - Gets the given metrics of a financial statement for its latest periods, as {ticker: {date: {metric: value}}}.
+   - periods optional value defaulted to 1. Enter the number of most recent periods wanted, or None for all of them.
+   - as_of optional value defaulted to None. Enter a 'YYYY-MM-DD' date for the latest periods on or before it.
+12) get_fields(fields, as_frame=False)
+   - Gets any fields of the price, summaryDetail, defaultKeyStatistics and financialData modules as a FieldTable.
+   - fields is a list of field names, or of 'module.field' names for fields of other modules.
+   - as_frame optional value defaulted to False. Enter True for a pandas DataFrame with one row per ticker.
+13) get_derived_metrics(price_type='current', as_frame=False)
+   - Computes eps, shares outstanding, enterprise value, ev/ebitda, margins and payout ratio for every ticker at once.
+14) get_indicators(start_date, end_date, time_interval, sma=(50, 200), ema=(12, 26), rsi=14, atr=14, volatility=20)
+   - Computes moving averages, rsi, atr and rolling volatility from the historical prices as an IndicatorSet per ticker.
+   - IndicatorSet.update(high, low, close) updates every indicator with a new bar in constant time.
+15) get_adjusted_price_data(start_date, end_date, time_interval, dividends=True, split_adjusted=True, resample=False)
+   - Gets historical prices as PriceArrays with open, high, low and close adjusted for dividends, as adjclose is.
+   - split_adjusted optional value defaulted to True. Enter False for prices and volume as traded before splits.
+16) screen(conditions, max_age=None)
+   - Gets the tickers meeting all the conditions, e.g. 'marketCap > 2B and trailingPE < 15 and payoutRatio < 0.6'.
+   - max_age optional value defaulted to None. Enter seconds after which the screened fields are downloaded again.
 
 Usage Examples:
 from yahoofinancials import YahooFinancials
@@ -41,12 +81,34 @@ earnings_data = yahoo_financials.get_stock_earnings_data()
 historical_prices = yahoo_financials.get_historical_price_data('2015-01-15', '2017-10-15', 'weekly')
 """
 
-from .calcs import num_shares_outstanding, eps
-from .data import YahooFinanceData
+import logging
+import pickle
+from concurrent.futures import Future
+
+from .calcs import (num_shares_outstanding, eps, enterprise_value, eps_array, ev_to_ebitda, margin,
+                    num_shares_outstanding_array, payout_ratio)
+from .data import YahooFinanceData, DataNotFound, ManagedException, clean_chart_content
+from .adjust import adjust_prices
+from .arrow import BatchWriter, fundamentals_record_batch, fundamentals_schema, history_record_batch, history_schema
+from .fields import FieldTable, resolve_fields
+from .frames import columns_frame, history_frame, module_frame, statement_frame
+from .fundamentals import fundamentals_fields
+from .indicators import IndicatorSet
+from .screen import Snapshot, parse_conditions
 
 __version__ = "1.17++"
 __author__ = "Connor Sanders"
 
+# quoteSummary fields used by get_derived_metrics()
+DERIVED_INPUTS = ('regularMarketPrice', 'trailingPE', 'marketCap', 'dayLow', 'dayHigh', 'dividendRate', 'totalDebt',
+                  'totalCash', 'ebitda', 'totalRevenue', 'grossProfits')
+
+# bars per year of each time_interval, used to annualize the volatility of get_indicators()
+PERIODS_PER_YEAR = {'daily': 252, 'weekly': 52, 'monthly': 12}
+
+# quoteSummary modules loaded by prefetch() by default
+PREFETCH_MODULES = ('price', 'summaryDetail', 'defaultKeyStatistics', 'financialData')
+
 
 # Class containing methods to create stock data extracts
 class YahooFinancials(YahooFinanceData):
@@ -64,19 +126,55 @@ class YahooFinancials(YahooFinanceData):
     max_workers: int, default 8, optional
         Defines the number of workers used to make concurrent requests.
         Only relevant if concurrent=True
+    processes: int, default None, optional
+        Number of worker processes cleaning the responses of iter_historical_price_data and
+        export_historical_price_data. Responses are cleaned on the request threads if None.
+        Other methods, get_historical_price_data and the financial statements included, keep the decoded
+        responses in the cache for the other getters to reuse, they clean them on the request threads and
+        log a warning when processes is set.
+        Raise max_workers to at least processes to keep the processes busy.
+        Call close(), or use the instance as a context manager, to shut the processes down.
     timeout: int, default 30, optional
         Defines how long a request will stay open.
     proxies: str or list, default None, optional
         Defines any proxies to use during this instantiation.
     flat_format: bool, default False, optional
         If set to True, returns fundamental data in a flattened format, i.e. without the list of dicts.
+    json_decoder: str or callable, default None, optional
+        Decoder for the raw response bytes, 'json' or 'orjson'. Uses orjson if installed and json otherwise when None.
+    cache_ttl: int, default None, optional
+        Seconds a cached response stays valid. Responses are cached for the life of the instance if None.
+    stale_while_revalidate: bool, default False, optional
+        If set to True, expired responses are returned at once and refreshed on a background thread.
+        Only relevant if cache_ttl is set.
+    refresh_ahead: float, default 0.75, optional
+        Fraction of cache_ttl after which frequently read responses are refreshed in the background
+        ahead of their expiry, None to only refresh expired responses. Only relevant if stale_while_revalidate
+        is set, no background request is made otherwise.
+    error_ttl: int, default 60, optional
+        Seconds a transient request error (throttling, server or connection error) is cached before retrying.
+    not_found_ttl: int, default 86400, optional
+        Seconds a permanent request error (unknown or delisted ticker, no data) is cached before retrying.
+    bad_ticker_file: str, default None, optional
+        Path of a json file used to persist the registry of tickers yahoo does not know.
+        Known-bad tickers are skipped, and return None, without spending a request on them.
+    bad_ticker_ttl: int, default 604800, optional
+        Seconds a ticker stays in the bad ticker registry. Tickers stay registered forever if None.
     """
 
     # Private method that handles financial statement extraction
-    def _run_financial_stmt(self, statement_type, report_num, frequency, reformat):
+    def _run_financial_stmt(self, statement_type, report_num, frequency, reformat, as_frame=False, as_matrix=False):
+        self._warn_processes('financial statements')
         hist_obj = {"interval": frequency}
         report_name = self.YAHOO_FINANCIAL_TYPES[statement_type][report_num]
-        if reformat:
+        if as_matrix:
+            hist_obj['matrix'] = True
+            raw_data = self.get_stock_data(statement_type, report_name=report_name, hist_obj=hist_obj)
+            data = {report_name: {tick: raw_data[tick] for tick in self.tickers}}
+        elif as_frame:
+            raw_data = self.get_stock_data(statement_type, report_name=report_name, hist_obj=hist_obj)
+            data = {report_name: statement_frame(raw_data, self.tickers)}
+        elif reformat:
             raw_data = self.get_stock_data(statement_type, report_name=report_name, hist_obj=hist_obj)
             data = self.get_reformatted_stmt_data(raw_data)
         else:
@@ -84,28 +182,50 @@ class YahooFinancials(YahooFinanceData):
         return data
 
     # Public Method for the user to get financial statement data
-    def get_financial_stmts(self, frequency, statement_type, reformat=True):
+    def get_financial_stmts(self, frequency, statement_type, reformat=True, as_frame=False, as_matrix=False):
         report_num = self.get_report_type(frequency)
         if isinstance(statement_type, str):
-            data = self._run_financial_stmt(statement_type, report_num, frequency, reformat)
+            data = self._run_financial_stmt(statement_type, report_num, frequency, reformat, as_frame, as_matrix)
         else:
             data = {}
             for stmt_type in statement_type:
-                re_data = self._run_financial_stmt(stmt_type, report_num, frequency, reformat)
+                re_data = self._run_financial_stmt(stmt_type, report_num, frequency, reformat, as_frame, as_matrix)
                 data.update(re_data)
         return data
 
+    # Public Method for the user to get several metrics of a financial statement for its latest periods
+    def get_statement_metrics(self, frequency, statement_type, metrics, periods=1, as_of=None):
+        report_num = self.get_report_type(frequency)
+        report_name = self.YAHOO_FINANCIAL_TYPES[statement_type][report_num]
+        matrices = self._run_financial_stmt(statement_type, report_num, frequency, False, as_matrix=True)[report_name]
+        data = {}
+        for tick in self.tickers:
+            matrix = matrices[tick]
+            if matrix is None:
+                data.update({tick: None})
+            else:
+                data.update({tick: matrix.select(metrics, matrix.last(periods, as_of))})
+        return data
+
+    # Private Method to get cleaned module data, as a frame with one row per ticker if as_frame
+    def _get_clean_module_data(self, raw_data, report_type, as_frame):
+        data = self.get_clean_data(raw_data, report_type)
+        if as_frame:
+            return module_frame(data, self.tickers)
+        return data
+
     # Public Method for the user to get stock price data
-    def get_stock_price_data(self, reformat=True):
-        if reformat:
-            return self.get_clean_data(self.get_stock_tech_data('price'), 'price')
+    def get_stock_price_data(self, reformat=True, as_frame=False):
+        if reformat or as_frame:
+            return self._get_clean_module_data(self.get_stock_tech_data('price'), 'price', as_frame)
         else:
             return self.get_stock_tech_data('price')
 
     # Public Method for the user to return key-statistics data
-    def get_key_statistics_data(self, reformat=True):
-        if reformat:
-            return self.get_clean_data(self.get_stock_tech_data('defaultKeyStatistics'), 'defaultKeyStatistics')
+    def get_key_statistics_data(self, reformat=True, as_frame=False):
+        if reformat or as_frame:
+            return self._get_clean_module_data(self.get_stock_tech_data('defaultKeyStatistics'),
+                                               'defaultKeyStatistics', as_frame)
         else:
             return self.get_stock_tech_data('defaultKeyStatistics')
 
@@ -123,17 +243,17 @@ class YahooFinancials(YahooFinanceData):
         return self.get_stock_tech_data('earnings')
 
     # Public Method for the user to return financial data
-    def get_financial_data(self, reformat=True):
-        if reformat:
-            return self.get_clean_data(self.get_stock_data(statement_type='keystats', tech_type='financialData'),
-                                       'financialData')
+    def get_financial_data(self, reformat=True, as_frame=False):
+        if reformat or as_frame:
+            raw_data = self.get_stock_data(statement_type='keystats', tech_type='financialData')
+            return self._get_clean_module_data(raw_data, 'financialData', as_frame)
         else:
             return self.get_stock_data(statement_type='keystats', tech_type='financialData')
 
     # Public Method for the user to get stock summary data
-    def get_summary_data(self, reformat=True):
-        if reformat:
-            return self.get_clean_data(self.get_stock_tech_data('summaryDetail'), 'summaryDetail')
+    def get_summary_data(self, reformat=True, as_frame=False):
+        if reformat or as_frame:
+            return self._get_clean_module_data(self.get_stock_tech_data('summaryDetail'), 'summaryDetail', as_frame)
         else:
             return self.get_stock_tech_data('summaryDetail')
 
@@ -152,53 +272,289 @@ class YahooFinancials(YahooFinanceData):
     def _get_analytic_data(self, tech_type):
         return self.get_stock_data(statement_type='analytic', tech_type=tech_type)
 
-    # Public Method for user to get historical price data with
-    def get_historical_price_data(self, start_date, end_date, time_interval):
+    # Private Method to build the hist_obj of a historical price data request
+    def _get_hist_obj(self, start_date, end_date, time_interval, resample=False):
         interval_code = self.get_time_code(time_interval)
         start = self.format_date(start_date)
         end = self.format_date(end_date)
         hist_obj = {'start': start, 'end': end, 'interval': interval_code}
-        return self.get_stock_data('history', hist_obj=hist_obj)
+        if resample:
+            hist_obj['resample'] = True
+        return hist_obj
+
+    # Public Method for user to get historical price data with
+    def get_historical_price_data(self, start_date, end_date, time_interval, columnar=False, as_frame=False,
+                                  as_records=False, resample=False):
+        self._warn_processes('get_historical_price_data')
+        hist_obj = self._get_hist_obj(start_date, end_date, time_interval, resample)
+        if columnar or as_frame:
+            hist_obj['columnar'] = True
+        elif as_records:
+            hist_obj['records'] = True
+        data = self.get_stock_data('history', hist_obj=hist_obj)
+        if as_frame:
+            return history_frame(data)
+        return data
+
+    # Public Method for the user to get historical prices adjusted for dividends and splits from the cached data
+    def get_adjusted_price_data(self, start_date, end_date, time_interval, dividends=True, split_adjusted=True,
+                                resample=False):
+        data = self.get_historical_price_data(start_date, end_date, time_interval, columnar=True, resample=resample)
+        for hist in data.values():
+            if hist and hist.get('prices') is not None:
+                hist['prices'] = adjust_prices(hist['prices'], hist.get('eventsData'), dividends, split_adjusted)
+        return data
+
+    # Public Method for the user to get technical indicators computed from the historical price data of every ticker
+    def get_indicators(self, start_date, end_date, time_interval, sma=(50, 200), ema=(12, 26), rsi=14, atr=14,
+                       volatility=20):
+        data = self.get_historical_price_data(start_date, end_date, time_interval, columnar=True)
+        periods_per_year = PERIODS_PER_YEAR[time_interval.lower()]
+        re_data = {}
+        for tick in self.tickers:
+            prices = (data.get(tick) or {}).get('prices')
+            if prices is None:
+                re_data[tick] = None
+                continue
+            re_data[tick] = IndicatorSet(sma, ema, rsi, atr, volatility, periods_per_year).run(prices)
+        return re_data
+
+    # Private Method to get the data of one ticker, dropping its response from the cache unless it was cached before
+    def _get_uncached_ticker_data(self, tick, url, statement_type, report_name, hist_obj):
+        cached = url in self._cache
+        data = self._get_ticker_data(tick, statement_type, '', report_name, hist_obj)[tick]
+        if not cached:
+            self._cache.pop(url)
+            self._matrices.pop(url, None)
+        return data
+
+    # Public Method for the user to iterate historical price data one ticker at a time, as (ticker, data) pairs
+    def iter_historical_price_data(self, start_date, end_date, time_interval, columnar=False, as_records=False,
+                                   completion_order=False, resample=False):
+        hist_obj = self._get_hist_obj(start_date, end_date, time_interval, resample)
+        if columnar:
+            hist_obj['columnar'] = True
+        elif as_records:
+            hist_obj['records'] = True
+
+        processes = self.processes and self._decoder_picklable()
+
+        def get_hist(tick):
+            url, resample = self._history_request(hist_obj, tick)
+            if processes and url not in self._cache and tick not in self.bad_tickers:
+                return self._submit_history(tick, url, hist_obj, resample)
+            return self._get_uncached_ticker_data(tick, url, 'history', '', hist_obj)
+
+        if processes:
+            # started from this thread rather than the request threads
+            self._get_process_pool()
+        for tick, hist, _ in self._run_concurrent(get_hist, self.tickers, ordered=not completion_order):
+            if isinstance(hist, Future):
+                hist = self._history_result(tick, hist_obj, hist)
+            yield tick, hist
+
+    # Private Method to tell whether the json decoder can be sent to the worker processes
+    # lambdas and local functions cannot be pickled, the histories are then cleaned on the request threads
+    def _decoder_picklable(self):
+        try:
+            pickle.dumps(self._json_loads)
+            return True
+        except (pickle.PicklingError, AttributeError, TypeError):
+            logging.warning("yahoofinancials json_decoder %r cannot be sent to worker processes, "
+                            "cleaning the histories on the request threads", self._json_loads)
+            return False
+
+    # Private Method to warn once per method that the processes option has no effect on it
+    # methods keeping the decoded responses in the cache, for the other getters to reuse, clean them on the threads
+    def _warn_processes(self, method):
+        if self.processes and method not in self._processes_warned:
+            self._processes_warned.add(method)
+            logging.warning("yahoofinancials processes=%s has no effect on %s, only iter_historical_price_data and "
+                            "export_historical_price_data clean responses in worker processes",
+                            self.processes, method)
+
+    # Private Method to get the pool of worker processes of process mode, started on first use
+    def _get_process_pool(self):
+        if self._process_pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._process_pool = ProcessPoolExecutor(max_workers=self.processes)
+        return self._process_pool
+
+    # Public Method for the user to shut down the worker processes of process mode, started again on next use
+    def close(self):
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # Private Method to fetch the raw chart response of a ticker and submit its cleaning to a worker process
+    def _submit_history(self, tick, url, hist_obj, resample):
+        try:
+            content = self._fetch_content(url)
+        except ManagedException as e:
+            return self._history_error(tick, hist_obj, resample, e)
+        return self._get_process_pool().submit(clean_chart_content, content, hist_obj, resample, self._json_loads,
+                                               url)
+
+    # Private Method to wait for the history of a ticker cleaned by a worker process, caching its error if any
+    def _history_result(self, tick, hist_obj, future):
+        try:
+            return future.result()
+        except ManagedException as e:
+            url, resample = self._history_request(hist_obj, tick)
+            self._cache.put_error(url, e, permanent=isinstance(e, DataNotFound))
+            return self._history_error(tick, hist_obj, resample, e)
+
+    # Private Method to get the history of a ticker after an error, as get_historical_price_data does:
+    # None for unknown tickers and urls without data, an empty history for other errors
+    def _history_error(self, tick, hist_obj, resample, error):
+        if isinstance(error, DataNotFound):
+            self._ticker_error(tick, 'history', error)
+            return None
+        return self._clean_history(None, hist_obj, resample)
+
+    # Public Method for the user to export historical price data to a parquet or arrow file, one ticker at a time
+    def export_historical_price_data(self, path, start_date, end_date, time_interval, file_format='parquet'):
+        schema = history_schema()
+        rows = {}
+        with BatchWriter(path, schema, file_format) as writer:
+            for tick, hist in self.iter_historical_price_data(start_date, end_date, time_interval, columnar=True):
+                prices = hist.get('prices') if hist else None
+                rows[tick] = 0 if prices is None else len(prices)
+                if rows[tick]:
+                    writer.write(history_record_batch(tick, prices, schema))
+        return rows
+
+    # Public Method for the user to export a financial statement to a parquet or arrow file, one ticker at a time
+    def export_financial_stmts(self, path, frequency, statement_type, file_format='parquet'):
+        report_type = self.YAHOO_FINANCIAL_TYPES[statement_type][0]
+        report_name = self.YAHOO_FINANCIAL_TYPES[statement_type][self.get_report_type(frequency)]
+        schema = fundamentals_schema(fundamentals_fields(report_type, frequency))
+        hist_obj = {"interval": frequency}
+        rows = {}
+        with BatchWriter(path, schema, file_format) as writer:
+            for tick in self.tickers:
+                url = self._fundamentals_url(tick, frequency, statement_type)
+                data = self._get_uncached_ticker_data(tick, url, statement_type, report_name, hist_obj)
+                rows[tick] = len(data) if data else 0
+                if rows[tick]:
+                    writer.write(fundamentals_record_batch(tick, data, schema))
+        return rows
+
+    # Private Method to tell whether the request of a prefetch task is cached
+    def _prefetch_cached(self, task):
+        tick, kind, arg = task
+        if kind == 'modules':
+            return all(self._module_url(tick, m) in self._cache for m in arg)
+        if kind == 'history':
+            return self._build_api_url(arg, tick) in self._cache
+        return self._fundamentals_url(tick, *arg) in self._cache
+
+    # Private Method to run the request of a prefetch task
+    # errors are cached with their url, the getters register unknown tickers when they read them
+    def _prefetch_task(self, task):
+        tick, kind, arg = task
+        if kind == 'modules':
+            self._fetch_modules(tick, arg)
+        elif kind == 'history':
+            self._fetch(self._build_api_url(arg, tick))
+        else:
+            self._fetch(self._fundamentals_url(tick, *arg))
+
+    # Public Method for the user to load data into the cache ahead of the get_* methods
+    def prefetch(self, tickers=None, modules=PREFETCH_MODULES, history=None, fundamentals=None, progress=None):
+        """
+        Loads the requested data for every ticker into the cache with as few requests as possible,
+        running them concurrently on max_workers threads within the request rate limit.
+
+        tickers: list of tickers, defaults to the tickers of this instance.
+        modules: quoteSummary modules, all fetched with one request per ticker.
+        history: (start_date, end_date, time_interval) or a list of them, as for get_historical_price_data.
+        fundamentals: (frequency, statement_type) or a list of them, as for get_financial_stmts.
+        progress: callable, called as progress(done, total, ticker, error) after each request.
+
+        Returns a dict with the number of requests made, of requests already cached and the errors by ticker.
+        """
+        tickers = self.tickers if tickers is None else [t.upper() for t in tickers]
+        if history and isinstance(history[0], str):
+            history = [history]
+        if fundamentals and isinstance(fundamentals[0], str):
+            fundamentals = [fundamentals]
+        hist_objs = [self._get_hist_obj(*h) for h in history or []]
+        fund_args = []
+        for frequency, statement_type in fundamentals or []:
+            for stmt_type in [statement_type] if isinstance(statement_type, str) else statement_type:
+                fund_args.append((frequency, stmt_type))
+        tasks = []
+        for tick in tickers:
+            if tick in self.bad_tickers:
+                continue
+            if modules:
+                tasks.append((tick, 'modules', tuple(modules)))
+            tasks.extend((tick, 'history', h) for h in hist_objs)
+            tasks.extend((tick, 'fundamentals', f) for f in fund_args)
+        todo = [t for t in tasks if not self._prefetch_cached(t)]
+        report = {'requests': len(todo), 'cached': len(tasks) - len(todo), 'errors': {}}
+        for done, (task, _, error) in enumerate(self._run_concurrent(self._prefetch_task, todo), start=1):
+            if error is not None:
+                report['errors'].setdefault(task[0], []).append(str(error))
+            if progress is not None:
+                progress(done, len(todo), task[0], error)
+        return report
+
+    # Public Method for the user to get many quoteSummary fields of every ticker as one ticker x field table
+    def get_fields(self, fields, as_frame=False):
+        columns = resolve_fields(fields)
+        modules = list(dict.fromkeys(m for m, _ in columns))
+        self.prefetch(modules=modules)
+        data = {m: self.get_module_fields(m, [f for mod, f in columns if mod == m]) for m in modules}
+        rows = [tuple(None if data[m][tick] is None else data[m][tick][f] for m, f in columns) for tick in self.tickers]
+        table = FieldTable(list(self.tickers), list(fields), rows)
+        if as_frame:
+            return table.to_frame()
+        return table
+
+    # Public Method for the user to screen the tickers on quoteSummary fields, returning the tickers meeting conditions
+    def screen(self, conditions, max_age=None):
+        conditions = parse_conditions(conditions)
+        if self._snapshot is None:
+            self._snapshot = Snapshot(self.tickers)
+        stale = self._snapshot.stale(list(dict.fromkeys(field for field, _, _ in conditions)), max_age)
+        if stale:
+            # columns loaded before are refreshed from new responses, not from the cached ones
+            expired = [field for field in stale if field in self._snapshot.columns]
+            for module in dict.fromkeys(m for m, _ in resolve_fields(expired)):
+                for tick in self.tickers:
+                    self._cache.pop(self._module_url(tick, module))
+            self._snapshot.update(self.get_fields(stale))
+        return self._snapshot.select(conditions)
+
+    # Private Method to get a single field of a quoteSummary module, without cleaning the rest of the module
+    def _stock_module_field(self, module, data_field):
+        data = self.get_module_fields(module, [data_field])
+        return {tick: None if data[tick] is None else data[tick][data_field] for tick in self.tickers}
 
     # Private Method for Functions needing stock_price_data
     def _stock_price_data(self, data_field):
-        price_data = self.get_stock_price_data()
-        ret_obj = {}
-        for tick in self.tickers:
-            if price_data[tick] is None:
-                ret_obj.update({tick: None})
-            else:
-                ret_obj.update({tick: price_data[tick].get(data_field)})
-        return ret_obj
+        return self._stock_module_field('price', data_field)
 
     # Private Method for Functions needing stock_price_data
     def _stock_summary_data(self, data_field):
-        sum_data = self.get_summary_data()
-        ret_obj = {}
-        for tick in self.tickers:
-            if sum_data[tick] is None:
-                ret_obj.update({tick: None})
-            else:
-                ret_obj.update({tick: sum_data[tick].get(data_field, None)})
-        return ret_obj
+        return self._stock_module_field('summaryDetail', data_field)
 
     # Private Method for Functions needing financial statement data
     def _financial_statement_data(self, stmt_type, stmt_code, field_name, freq):
-        re_data = self.get_financial_stmts(freq, stmt_type)[stmt_code]
+        report_num = self.get_report_type(freq)
+        matrices = self._run_financial_stmt(stmt_type, report_num, freq, False, as_matrix=True)[stmt_code]
         data = {}
         for tick in self.tickers:
-            try:
-                date_key = re_data[tick][0].keys()[0]
-            except:
-                try:
-                    date_key = list(re_data[tick][0].keys())[0]
-                except:
-                    date_key = None
-            if date_key is not None:
-                sub_data = re_data[tick][0][date_key][field_name]
-                data.update({tick: sub_data})
-            else:
-                data.update({tick: None})
+            matrix = matrices[tick]
+            data.update({tick: None if matrix is None else matrix.get(matrix.latest(), field_name)})
         return data
 
     # Public method to get daily dividend data
@@ -207,6 +563,12 @@ class YahooFinancials(YahooFinanceData):
         end = self.format_date(end_date)
         return self.get_stock_dividend_data(start, end, 'daily')
 
+    # Public method to get daily split data
+    def get_daily_split_data(self, start_date, end_date):
+        start = self.format_date(start_date)
+        end = self.format_date(end_date)
+        return self.get_stock_event_data(start, end, 'daily', 'splits')
+
     # Public Price Data Methods
     def get_current_price(self):
         return self._stock_price_data('regularMarketPrice')
@@ -346,6 +708,27 @@ class YahooFinancials(YahooFinanceData):
             ret_obj.update({tick: re_val})
         return ret_obj
 
+    # Public Method for the user to get metrics derived from quote data, computed for every ticker at once
+    def get_derived_metrics(self, price_type='current', as_frame=False):
+        inputs = self.get_fields(DERIVED_INPUTS)
+        col = {f: inputs.column(f) for f in DERIVED_INPUTS}
+        earnings_per_share = eps_array(col['regularMarketPrice'], col['trailingPE'])
+        ev = enterprise_value(col['marketCap'], col['totalDebt'], col['totalCash'])
+        metrics = {
+            'earningsPerShare': earnings_per_share,
+            'numSharesOutstanding': num_shares_outstanding_array(col['marketCap'], col['dayLow'], col['dayHigh'],
+                                                                 price_type, col['regularMarketPrice']),
+            'enterpriseValue': ev,
+            'evToEbitda': ev_to_ebitda(ev, col['ebitda']),
+            'grossMargin': margin(col['grossProfits'], col['totalRevenue']),
+            'ebitdaMargin': margin(col['ebitda'], col['totalRevenue']),
+            'payoutRatio': payout_ratio(col['dividendRate'], earnings_per_share),
+        }
+        if as_frame:
+            return columns_frame(metrics, inputs.tickers)
+        rows = zip(*[[None if v != v else v for v in values.tolist()] for values in metrics.values()])
+        return FieldTable(inputs.tickers, list(metrics), [tuple(row) for row in rows])
+
     def get_num_shares_outstanding(self, price_type='current'):
         today_low = self._stock_summary_data('dayHigh')
         today_high = self._stock_summary_data('dayLow')